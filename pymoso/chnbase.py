@@ -28,59 +28,690 @@ implementations.
 Listing
 --------------
 _mp_objmethod, function
+mp_repworker, function
+mp_forkworker, function
+get_moments, function
+merge_moments, function
+ncn_mask, function
+get_g_batch, function
+Executor(object), class
+SerialExecutor(Executor), class
+thread_chunk, function
+ThreadExecutor(Executor), class
+ProcessExecutor(Executor), class
+AsyncExecutor(Executor), class
 MOSOSolver(object), class
 RASolver(MOSOSolver), class
 RLESolver(RASolver), class
 Oracle(object), class
+AsyncOracle(Oracle), class
 """
-from statistics import mean, variance
 from math import sqrt, ceil, floor
-from .prng.mrg32k3a import get_next_prnstream, jump_substream, mrg32k3a, bsm
-from multiprocessing import Queue, Process
+from .prng.mrg32k3a import MRG32k3a, get_next_prnstream, jump_substream, jump_seed, get_stream_seed, a1p76, a2p76
+from multiprocessing import Queue, Process, Pool, current_process
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+from time import perf_counter
+from copy import copy
+from collections import ChainMap
+from operator import and_
 import sys
-from .chnutils import perturb, argsort, enorm, get_setnbors, get_nbors, is_lwep, get_nondom, does_strict_dominate, does_weak_dominate, does_dominate, get_biparetos
+try:
+    import numpy as np
+except ImportError:
+    np = None
+from .chnutils import perturb, argsort, enorm, get_setnbors, get_nbors, get_lweps, get_nondom, dominance_mask, dominance_matrix, ParetoArchive
 
 
-def mp_replicate(orccls, x, rngcls, seed):
+def mp_repworker(orccls, rngcls, seed, input, output):
     """
-    Wrap `Oracle.g` in a top-level function for use with multiprocessing.
+    Simulate chunks of replications from `input` queue with one oracle
+    and place the replications in `output` queue.
 
     Parameters
     ----------
     orccls : Oracle class
-    x : tuple of int
     rngcls : random.Random class
     seed : tuple of int
+    input : multiprocessing.Queue object
+        Items are the call and chunk indices, the point, the seed of
+        the first replication, and the number of replications
+    output : multiprocessing.Queue object
+        Items are the call and chunk indices, the list of replications
+        as returned by `Oracle.g`, and the time taken
+
+    Notes
+    -----
+    The oracle does not use crn itself. The substream seeds already
+    account for it.
+
+    See also
+    --------
+    ProcessExecutor
+    """
+    orc = orccls(rngcls(seed))
+    orc.set_crnflag(False)
+    for c, j, x, seed, k in iter(input.get, 'STOP'):
+        t = perf_counter()
+        try:
+            orc.rng.setstate(seed)
+            orc.crn_setobs()
+            res = list(orc.replicate(x, k))
+        except Exception as e:
+            res = e
+        output.put((c, j, res, perf_counter() - t))
+
+
+def mp_forkworker(job):
+    """
+    Run a method of some forks of a solver in a process.
+
+    Parameters
+    ----------
+    job : tuple
+        The list of forks, the name of the method, and the list of the
+        arguments of each fork. The forks share the snapshot of the
+        solver, which is sent once.
+
+    Returns
+    -------
+    list of tuple, or Exception
+        The output of 'RASolver.run_fork' for each fork, or the
+        exception raised
+
+    See also
+    --------
+    RASolver.run_forks
+    """
+    forks, method, argslist = job
+    try:
+        return [solver.run_fork(method, args) for solver, args in zip(forks, argslist)]
+    except BaseException as e:
+        # includes the exit of a solver error, which is already printed
+        return e
+
+
+def get_moments(reps, d):
+    """
+    Accumulate the sample means and sums of squared deviations of
+    simulation replications in one pass, using Welford's algorithm.
+
+    Parameters
+    ----------
+    reps : iterable of tuple
+        pairs of feasibility and objective values as returned by `Oracle.g`
+    d : int
+        number of objectives
 
     Returns
     -------
     isfeas : bool
-    objvals : tuple of float
+        True if every replication is feasible
+    n : int
+        number of replications accumulated
+    obmean : list of float
+        mean of each objective
+    obm2 : list of float
+        sum of squared deviations from the mean of each objective
+    """
+    dr = range(d)
+    isfeas = True
+    n = 0
+    obmean = [0.0 for k in dr]
+    obm2 = [0.0 for k in dr]
+    for isfeasi, oval in reps:
+        if not isfeasi:
+            isfeas = False
+        # consume the remaining replications but stop accumulating
+        if isfeas:
+            n += 1
+            for k in dr:
+                delta = oval[k] - obmean[k]
+                obmean[k] += delta/n
+                obm2[k] += delta*(oval[k] - obmean[k])
+    return isfeas, n, obmean, obm2
+
+
+def merge_moments(n1, obmean1, obm21, n2, obmean2, obm22):
+    """
+    Combine the moments of two disjoint sets of replications, using the
+    pairwise update of Chan, Golub, and LeVeque.
+
+    Parameters
+    ----------
+    n1 : int
+    obmean1 : list of float
+    obm21 : list of float
+    n2 : int
+    obmean2 : list of float
+    obm22 : list of float
+        numbers of replications, means, and sums of squared deviations
+        as returned by `get_moments`
+
+    Returns
+    -------
+    n : int
+    obmean : list of float
+    obm2 : list of float
+        moments of the union of the replications
+    """
+    n = n1 + n2
+    obmean = []
+    obm2 = []
+    for k in range(len(obmean1)):
+        delta = obmean2[k] - obmean1[k]
+        obmean.append(obmean1[k] + delta*n2/n)
+        obm2.append(obm21[k] + obm22[k] + delta*delta*n1*n2/n)
+    return n, obmean, obm2
+
+
+def ncn_mask(fxs, delxs, fss, delss):
+    """
+    Check definition 9 (b) of the non-conforming neighborhood for every
+    pair of a neighbor and a member of a candidate ALES at once, with
+    numpy if it is installed.
+
+    Parameters
+    ----------
+    fxs : list of tuple of float
+        Objective values of the neighbors
+    delxs : list of tuple of float
+        Relaxations of 'fxs'
+    fss : list of tuple of float
+        Objective values of the candidate ALES
+    delss : list of tuple of float
+        Relaxations of 'fss'
+
+    Returns
+    -------
+    list of bool
+        True for the neighbors in the non-conforming neighborhood
+
+    Notes
+    -----
+    The comparisons are those of dominance_mask and dominance_matrix,
+    so the result is the same with and without numpy.
+    """
+    if np is None:
+        # relax the members once rather than for every neighbor
+        fslos = [[a - b for a, b in zip(fs, dels)] for fs, dels in zip(fss, delss)]
+        fshis = [[a + b for a, b in zip(fs, dels)] for fs, dels in zip(fss, delss)]
+        mask = []
+        for fx, delx in zip(fxs, delxs):
+            # definition 9 (b) (i), (ii), and (iii), in turn over the
+            # members of the candidate ALES
+            isncn = not any(dominance_mask(fx, fss, kind='weak', reverse=True))
+            if isncn:
+                relaxsx = dominance_mask(fx, fslos, delx, kind='weak', reverse=True)
+                isncn = not any(map(and_, dominance_mask(fx, fss), relaxsx))
+            if isncn and not any(dominance_mask(fx, fss, kind='weak')):
+                isncn = not any(relaxsx) and not any(dominance_mask(fx, fshis, delx, kind='weak'))
+            mask.append(isncn)
+        return mask
+    fs = np.array(fss, dtype=float)
+    dels = np.array(delss, dtype=float)
+    # bound the size of the pairwise arrays
+    step = max(1, (1 << 20)//fs.size)
+    mask = []
+    for i in range(0, len(fxs), step):
+        fx = np.array(fxs[i:i + step], dtype=float)
+        delx = np.array(delxs[i:i + step], dtype=float)
+        # axis 0 is the neighbor, axis 1 the member
+        weakxs = dominance_matrix(fx, fs, kind='weak')
+        weaksx = dominance_matrix(fs, fx, kind='weak').T
+        relaxsx = dominance_matrix(fs, fx, dels, delx, kind='weak').T
+        relaxxs = dominance_matrix(fx, fs, delx, dels, kind='weak')
+        domxs = dominance_matrix(fx, fs)
+        # definition 9 (b) (i), (ii), and (iii)
+        notweakdom = ~weaksx.any(axis=1)
+        notrelaxdom = ~(domxs & relaxsx).any(axis=1)
+        wouldnotchange = ~(relaxsx | relaxxs).any(axis=1)
+        doesweakdom = weakxs.any(axis=1)
+        mask.extend((notweakdom & notrelaxdom & (doesweakdom | wouldnotchange)).tolist())
+    return mask
+
+
+def get_g_batch(orc):
+    """
+    Return the 'g_batch' method of an oracle if it simulates the same
+    'g' as the oracle.
+
+    A sub-class which overrides 'g' but not 'g_batch' would otherwise
+    inherit a 'g_batch' of a different simulation. 'g_batch' is used
+    only if the class defining it is the class defining 'g' or one of
+    its sub-classes.
+
+    Parameters
+    ----------
+    orc : Oracle object
+
+    Returns
+    -------
+    g_batch : method or None
+        None if the replications must loop over 'g'
+    """
+    g_cls = None
+    batch_cls = None
+    for cls in type(orc).__mro__:
+        if g_cls is None and 'g' in cls.__dict__:
+            g_cls = cls
+        if batch_cls is None and 'g_batch' in cls.__dict__:
+            batch_cls = cls
+    if batch_cls is None or (g_cls is not None and not issubclass(batch_cls, g_cls)):
+        return None
+    return orc.g_batch
+
+
+class Executor(object):
+    """
+    Base class of the replication executors of an oracle.
+
+    Parallel executors send the replications of a call in chunks of
+    consecutive substreams. The chunk size adapts to the measured time
+    per replication, so that cheap replications are sent in large
+    chunks and expensive ones are spread across the workers.
+
+    Attributes
+    ----------
+    num_workers : int
+    Number of threads or processes
+    rep_time : float
+    Moving average of the seconds per replication, or None before the
+    first chunk returns
+    chunk_time : float
+    Target seconds of simulation per chunk. Default is 0.05
+
+    Parameters
+    ----------
+    orc : Oracle object
+    num_workers : int
+
+    Notes
+    -----
+    Sub-classes implement `run(orc, jobs)`, which simulates the
+    replications of several points from given substream seeds and
+    returns them in order, exactly as `Oracle.replicate` would
+    serially.
+    """
+
+    def __init__(self, orc, num_workers=1):
+        self.num_workers = num_workers
+        self.rep_time = None
+        self.chunk_time = 0.05
+        super().__init__()
+
+    def chunk_size(self, m):
+        """
+        Compute the number of replications per chunk.
+
+        Parameters
+        ----------
+        m : int
+    number of replications of the call
+
+    Returns
+    -------
+    int
+        """
+        # at least 4 chunks per worker to balance the load
+        k = ceil(m/(4*self.num_workers))
+        if self.rep_time:
+            k = min(k, max(1, int(self.chunk_time/self.rep_time)))
+        return k
+
+    def update_rep_time(self, t, k):
+        """
+        Update the moving average time per replication.
+
+        Parameters
+        ----------
+        t : float
+    seconds taken by a chunk
+    k : int
+    number of replications in the chunk
+        """
+        rep_time = t/k
+        if self.rep_time:
+            rep_time = 0.8*self.rep_time + 0.2*rep_time
+        self.rep_time = rep_time
+
+    def replicate(self, orc, x, m):
+        """
+        Simulate 'm' replications at 'x' on the next substreams of
+        'orc.rng' and yield them in order.
+
+        Parameters
+        ----------
+        orc : Oracle object
+        x : tuple of int
+        m : int
+
+    Yields
+    ------
+    tuple
+    Same as `Oracle.replicate`
+        """
+        streams = orc.crn_streams(m)
+        yield from self.run(orc, [(x, streams)])[0]
+
+    def run(self, orc, jobs):
+        """
+        Simulate the replications of several points.
+
+        Parameters
+        ----------
+        orc : Oracle object
+        jobs : list of tuple
+    pairs of a point and the list of seeds of its replications
+
+    Returns
+    -------
+    list of list of tuple
+    The replications of each point in order, as returned by 'g'
+        """
+        raise NotImplementedError
+
+    def shutdown(self):
+        """
+        Release the workers.
+        """
+        pass
+
+
+class SerialExecutor(Executor):
+    """
+    Simulate replications one after another in the calling process.
+    """
+
+    def replicate(self, orc, x, m):
+        """
+        Simulate 'm' replications at 'x' on the next substreams of
+        'orc.rng' and yield them in order. Use 'g_batch' if the oracle
+        implements it for its 'g', and 'g' otherwise.
+
+        Parameters
+        ----------
+        orc : Oracle object
+        x : tuple of int
+        m : int
+
+    Yields
+    ------
+    tuple
+    Same as `Oracle.replicate`
+        """
+        g_batch = get_g_batch(orc)
+        if g_batch:
+            streams = orc.crn_streams(m)
+            yield from g_batch(x, m, streams)
+        else:
+            for i in range(m):
+                yield orc.g(x, orc.rng)
+                orc.crn_nextobs()
+
+    def run(self, orc, jobs):
+        """
+        Simulate the replications of several points one after another.
+        Leaves 'orc.rng' at an arbitrary state.
+
+        Parameters
+        ----------
+        orc : Oracle object
+        jobs : list of tuple
+    pairs of a point and the list of seeds of its replications
+
+    Returns
+    -------
+    list of list of tuple
+    The replications of each point in order, as returned by 'g'
+        """
+        g_batch = get_g_batch(orc)
+        res = []
+        for x, streams in jobs:
+            if g_batch:
+                res.append(list(g_batch(x, len(streams), streams)))
+            else:
+                reps = []
+                for seed in streams:
+                    orc.rng.setstate(seed)
+                    reps.append(orc.g(x, orc.rng))
+                res.append(reps)
+        return res
+
+
+def thread_chunk(orc, x, streams):
+    """
+    Simulate one replication of 'x' from each seed in 'streams'.
+
+    Parameters
+    ----------
+    orc : Oracle object
+    x : tuple of int
+    streams : list of tuple of int
+
+    Returns
+    -------
+    reps : list of tuple
+        Same as `Oracle.replicate`
+    t : float
+        The time taken
 
     See also
     --------
-    Oracle.replicate
+    ThreadExecutor
     """
+    t = perf_counter()
+    g_batch = get_g_batch(orc)
+    if g_batch:
+        reps = list(g_batch(x, len(streams), streams))
+    else:
+        rngcls = type(orc.rng)
+        reps = [orc.g(x, rngcls(seed)) for seed in streams]
+    return reps, perf_counter() - t
 
-    rng = rngcls(seed)
-    orc = orccls(rng)
-    orc.set_crnflag(False)
-    isfeas, objvals = orc.g(x, rng)
-    return isfeas, objvals
+
+class ThreadExecutor(Executor):
+    """
+    Simulate replications in parallel with a pool of threads which
+    share the oracle. Each replication gets its own generator on its
+    substream, so 'g' must only use its 'rng' argument. Useful for
+    oracles which release the GIL, e.g. in NumPy or C code.
+
+    Parameters
+    ----------
+    orc : Oracle object
+    num_workers : int
+    """
+
+    def __init__(self, orc, num_workers):
+        super().__init__(orc, num_workers)
+        self.pool = ThreadPoolExecutor(num_workers)
+
+    def run(self, orc, jobs):
+        """
+        Simulate the replications of several points in chunks on the
+        threads.
+
+        Parameters
+        ----------
+        orc : Oracle object
+        jobs : list of tuple
+    pairs of a point and the list of seeds of its replications
+
+    Returns
+    -------
+    list of list of tuple
+    The replications of each point in order, as returned by 'g'
+        """
+        k = self.chunk_size(sum(len(streams) for x, streams in jobs))
+        futures = [[self.pool.submit(thread_chunk, orc, x, streams[i:i + k]) for i in range(0, len(streams), k)] for x, streams in jobs]
+        res = []
+        for jfutures in futures:
+            reps = []
+            for f in jfutures:
+                chunk, t = f.result()
+                self.update_rep_time(t, len(chunk))
+                reps.extend(chunk)
+            res.append(reps)
+        return res
+
+    def shutdown(self):
+        """
+        Stop the threads.
+        """
+        self.pool.shutdown()
 
 
-def mp_worker(input, output):
+class ProcessExecutor(Executor):
     """
-    Process an item from `input` queue and place results in `output` queue.
+    Simulate replications in parallel with a pool of processes, each
+    of which keeps one oracle for the whole run.
+
+    Chunks are tagged with their call and position, and the
+    replications are returned in order, so results are identical to
+    serial ones.
+
+    Attributes
+    ----------
+    num_calls : int
+    Number of calls so far, which tags the chunks of each call
 
     Parameters
     ----------
-    input : multiprocessing.Queue object
-    output : multiprocessing.Queue object
+    orc : Oracle object
+    The oracle whose class the processes simulate
+    num_workers : int
     """
-    for func, args in iter(input.get, 'STOP'):
-        result = func(*args)
-        output.put(result)
+
+    def __init__(self, orc, num_workers):
+        super().__init__(orc, num_workers)
+        self.num_calls = 0
+        self.req_q = Queue()
+        self.res_q = Queue()
+        self.proc = []
+        args = (type(orc), type(orc.rng), orc.rng.get_seed(), self.req_q, self.res_q)
+        for i in range(num_workers):
+            p = Process(target=mp_repworker, args=args, daemon=True)
+            p.start()
+            self.proc.append(p)
+
+    def run(self, orc, jobs):
+        """
+        Simulate the replications of several points in chunks on the
+        processes.
+
+        Parameters
+        ----------
+        orc : Oracle object
+        jobs : list of tuple
+    pairs of a point and the list of seeds of its replications
+
+    Returns
+    -------
+    list of list of tuple
+    The replications of each point in order, as returned by 'g'
+        """
+        self.num_calls += 1
+        c = self.num_calls
+        k = self.chunk_size(sum(len(streams) for x, streams in jobs))
+        # the job of each chunk
+        chunkjob = []
+        for jx, (x, streams) in enumerate(jobs):
+            for i in range(0, len(streams), k):
+                self.req_q.put((c, len(chunkjob), x, streams[i], min(k, len(streams) - i)))
+                chunkjob.append(jx)
+        done = [None for j in chunkjob]
+        for i in chunkjob:
+            cj, j, resj, t = self.res_q.get()
+            # discard the chunks of a call which raised an exception
+            while not cj == c:
+                cj, j, resj, t = self.res_q.get()
+            if isinstance(resj, Exception):
+                raise resj
+            self.update_rep_time(t, len(resj))
+            done[j] = resj
+        res = [[] for job in jobs]
+        for j, jx in enumerate(chunkjob):
+            res[jx].extend(done[j])
+        return res
+
+    def shutdown(self):
+        """
+        Terminate the processes.
+        """
+        for p in self.proc:
+            p.terminate()
+            p.join()
+
+
+class AsyncExecutor(Executor):
+    """
+    Simulate the replications of an AsyncOracle concurrently on an
+    event loop, with at most 'num_workers' replications in flight.
+    Each replication gets its own generator on its substream.
+
+    Attributes
+    ----------
+    orc : AsyncOracle
+    loop : asyncio event loop
+    Kept for the whole run, so that the oracle may keep connections
+    to external simulators open between calls
+
+    Parameters
+    ----------
+    orc : AsyncOracle object
+    num_workers : int
+    """
+
+    def __init__(self, orc, num_workers):
+        super().__init__(orc, num_workers)
+        self.orc = orc
+        self.loop = asyncio.new_event_loop()
+
+    def run(self, orc, jobs):
+        """
+        Simulate the replications of several points concurrently.
+
+        Parameters
+        ----------
+        orc : AsyncOracle object
+        jobs : list of tuple
+    pairs of a point and the list of seeds of its replications
+
+    Returns
+    -------
+    list of list of tuple
+    The replications of each point in order, as returned by 'g'
+        """
+        return self.loop.run_until_complete(self.gather(orc, jobs))
+
+    async def gather(self, orc, jobs):
+        """
+        Coroutine of 'run'.
+        """
+        limit = asyncio.Semaphore(self.num_workers)
+        rngcls = type(orc.rng)
+        async def rep(x, seed):
+            async with limit:
+                return await orc.g(x, rngcls(seed))
+        reps = await asyncio.gather(*[rep(x, seed) for x, streams in jobs for seed in streams])
+        res = []
+        i = 0
+        for x, streams in jobs:
+            res.append(reps[i:i + len(streams)])
+            i += len(streams)
+        return res
+
+    def shutdown(self):
+        """
+        Close the oracle and the event loop.
+        """
+        if not self.loop.is_closed():
+            self.loop.run_until_complete(self.orc.close())
+            self.loop.close()
+
+
+executors = {'serial': SerialExecutor, 'threads': ThreadExecutor, 'processes': ProcessExecutor}
 
 
 class MOSOSolver(object):
@@ -153,6 +784,49 @@ class RASolver(MOSOSolver):
     sehat : dict
     Like gbar, but maps feasible points to standard errors of
     the objective values.
+    reuse : bool
+    If True, keep the replications of every point across iterations
+    and only simulate the extra replications each iteration needs.
+    Default is False.
+    gstats : dict
+    Dictionary of {tuple of int: tuple} mapping feasible points to
+    their number of replications and the means and sums of squared
+    deviations of their objective values. Used when reuse is True.
+    It keeps every visited point, i.e. about 1 + 2*num_obj floats per
+    point, unless reuse_age is positive.
+    reuse_age : int
+    If positive, the number of iterations after its last estimate
+    that a point is kept in gstats. Default is 0, kept for the run.
+    gstats_nu : dict
+    Dictionary of {tuple of int: int} mapping the points of gstats to
+    the last iteration in which they were estimated
+    specne : int
+    If positive, the number of neighbors 'ne' simulates at once.
+    Default is 0, one at a time. Ignored when reuse is True.
+    spec_hits : dict
+    Like gbar, but maps points simulated ahead of need and not yet
+    used to the output of orc.hit. Only kept with crn.
+    spec_calls : int
+    The number of calls to orc.g simulated ahead of need and not
+    counted in num_calls
+    objpar : int
+    If larger than 1, the number of processes with which 'get_min'
+    runs the spline of every objective at once, each on its own fork
+    of the solver. The results are the same for every objpar larger
+    than 1, but differ from those with 0 or 1. Default is 0, every
+    spline continues from the previous one.
+    epspar : int
+    If positive, 'eps_windows' searches every epsilon window on its
+    own fork of the solver, at once in epspar processes if it is
+    larger than 1. The results are the same for every positive
+    epspar, but differ from those with 0. Default is 0, every window
+    continues from the previous one.
+    eps_times : dict
+    Dictionary of {iteration int : list of float} of the wall time in
+    seconds of every epsilon window searched in 'eps_windows'
+    fork_pool : multiprocessing.Pool object or None
+    The processes of objpar and epspar, started when first needed
+    and terminated at the end of 'solve'
     m : int
     Iteration sample size which is automatically updated
     b : int
@@ -177,6 +851,17 @@ class RASolver(MOSOSolver):
         self.nbor_rad = kwargs.pop('radius', 1)
         self.mconst = kwargs.pop('mconst', 2)
         self.bconst = kwargs.pop('bconst', 8)
+        self.reuse = bool(kwargs.pop('reuse', False))
+        self.reuse_age = int(kwargs.pop('reuse_age', 0))
+        self.gstats = dict()
+        self.gstats_nu = dict()
+        self.specne = int(kwargs.pop('specne', 0))
+        self.spec_hits = dict()
+        self.spec_calls = 0
+        self.objpar = int(kwargs.pop('objpar', 0))
+        self.epspar = int(kwargs.pop('epspar', 0))
+        self.eps_times = dict()
+        self.fork_pool = None
         try:
             self.sprn = kwargs.pop('sprn')
             self.x0 = kwargs.pop('x0')
@@ -209,6 +894,7 @@ class RASolver(MOSOSolver):
         self.nu = 0
         # invoke the Retrospective approximation algorithm
         self.rasolve(lesnu, simcalls, budget)
+        self.fork_cleanup()
         # name the data keys and return the results
         resdict = {'itersoln': lesnu, 'simcalls': simcalls, 'endseed': self.endseed}
         return resdict
@@ -235,17 +921,25 @@ class RASolver(MOSOSolver):
 
         while self.num_calls < budget:
             self.nu += 1
+            if self.reuse_age:
+                self.prune_gstats()
             self.m = self.calc_m(self.nu)
             self.b = self.calc_b(self.nu)
             self.gbar = dict()
             self.sehat = dict()
+            self.spec_hits = dict()
             #print(self.nu)
             #print('warm start: ', phatnu[self.nu - 1])
             aold = phatnu[self.nu - 1]
             phatnu[self.nu] = self.spsolve(aold)
             #print('spsolve: ', phatnu[self.nu])
             simcalls[self.nu] = self.num_calls
-            self.orc.crn_advance()
+            if self.reuse and self.orc.crnflag:
+                # keep the crn baseline so replications added to a
+                # point remain common with those of every other point
+                self.orc.crn_check()
+            else:
+                self.orc.crn_advance()
             self.endseed = self.orc.rng.get_seed()
 
     def get_min(self, mcS):
@@ -270,11 +964,17 @@ class RASolver(MOSOSolver):
         xmin = set()
         krange = range(self.num_obj)
         mcT = set()
-        for k in krange:
-            kmin = min(mcS | {self.x0}, key=lambda t: self.gbar[t][k])
-            tb, xmink, _, _ = self.spline(kmin, unconst, k, kcon)
-            xmin |= {xmink}
-            mcT |= tb
+        if self.num_obj > 1 and self.objpar > 1:
+            kmins = [min(mcS | {self.x0}, key=lambda t: self.gbar[t][k]) for k in krange]
+            for tb, xmink, _, _ in self.par_spline(kmins, unconst, kcon):
+                xmin |= {xmink}
+                mcT |= tb
+        else:
+            for k in krange:
+                kmin = min(mcS | {self.x0}, key=lambda t: self.gbar[t][k])
+                tb, xmink, _, _ = self.spline(kmin, unconst, k, kcon)
+                xmin |= {xmink}
+                mcT |= tb
         tmp = {x: self.gbar[x] for x in xmin | mcS | mcT | {self.x0}}
         xmin = get_nondom(tmp)
         return xmin
@@ -328,6 +1028,305 @@ class RASolver(MOSOSolver):
                 should_stop = True
         return mcT, xn, fxn, sexn
 
+    def par_spline(self, x0s, e=float('inf'), kcon=0):
+        """
+        Run 'spline' on every objective, each on a fork of the solver,
+        at once in 'objpar' processes, and merge the forks.
+
+        Parameters
+        ----------
+        x0s : list of tuple of int
+    x0s[k] is the feasible point from which to minimize objective k
+    e : float
+    kcon : int
+    Same as in 'spline'
+
+    Returns
+    -------
+    list of tuple
+    The output of 'spline' for every objective
+
+    Notes
+    -----
+    Fork k starts from the simulations of the solver and uses the
+    streams of 'fork(k)' whatever the number of processes, so the
+    results are the same for every 'objpar' larger than 1.
+        """
+        argslist = [(x0s[k], e, k, kcon) for k in range(len(x0s))]
+        res = self.run_forks('spline', argslist, self.objpar)
+        return [out for out, t in res]
+
+    def run_forks(self, method, argslist, num_proc):
+        """
+        Run a method on forks of the solver, one fork for every list
+        of arguments, and merge the forks.
+
+        Parameters
+        ----------
+        method : str
+    Name of the method, e.g. 'spline'
+    argslist : list of tuple
+    argslist[j] are the arguments of the method on fork j
+    num_proc : int
+    If larger than 1, the number of processes in which to run the
+    forks at once. Otherwise, or in a daemonic process, e.g. a
+    process of testsolve, the forks run one after the other.
+
+    Returns
+    -------
+    list of tuple
+    The output of the method on every fork and its wall time in
+    seconds
+        """
+        forks = [self.fork(j) for j in range(len(argslist))]
+        if num_proc > 1 and len(forks) > 1 and not current_process().daemon:
+            if isinstance(self.orc, AsyncOracle):
+                print('--* Error: objpar and epspar larger than 1 are not supported by an AsyncOracle. ')
+                print('--* Aborting. ')
+                sys.exit()
+            # every process gets every num_proc-th fork, so that the
+            # shared snapshot of the solver is sent once per process
+            jobs = [(forks[w::num_proc], method, argslist[w::num_proc]) for w in range(min(num_proc, len(forks)))]
+            try:
+                outs = self.get_fork_pool().map(mp_forkworker, jobs, 1)
+            except Exception:
+                print('--* Error: Unable to run the forks of ', type(self).__name__, ' in processes. ')
+                print('--* Message: ', sys.exc_info()[1])
+                print('--* Ensure the oracle can be pickled. ')
+                print('--* Aborting. ')
+                sys.exit()
+            res = [None for solver in forks]
+            for w, out in enumerate(outs):
+                if isinstance(out, BaseException):
+                    if isinstance(out, SystemExit):
+                        sys.exit()
+                    raise out
+                for i, (r, t, solver) in enumerate(out):
+                    j = w + i*num_proc
+                    res[j] = (r, t)
+                    forks[j] = solver
+        else:
+            res = []
+            for solver, args in zip(forks, argslist):
+                r, t, solver = solver.run_fork(method, args)
+                res.append((r, t))
+        self.merge(forks)
+        return res
+
+    def run_fork(self, method, args):
+        """
+        Run a method on a fork and keep only the simulations of the fork.
+
+        Parameters
+        ----------
+        method : str
+    args : tuple
+    Same as in 'run_forks'
+
+    Returns
+    -------
+    out : object
+    The output of the method
+    t : float
+    The wall time in seconds
+    solver : RASolver
+    The fork
+        """
+        t0 = perf_counter()
+        out = getattr(self, method)(*args)
+        t = perf_counter() - t0
+        self.detach()
+        return out, t, self
+
+    def get_fork_pool(self):
+        """
+        Return the processes of objpar and epspar, starting them if
+        needed.
+
+        Returns
+        -------
+        multiprocessing.Pool object
+        """
+        if self.fork_pool is None:
+            self.fork_pool = Pool(max(self.objpar, self.epspar))
+        return self.fork_pool
+
+    def fork_cleanup(self):
+        """
+        Terminate the processes of objpar and epspar, if any.
+        """
+        if self.fork_pool is not None:
+            self.fork_pool.terminate()
+            self.fork_pool.join()
+            self.fork_pool = None
+
+    def fork(self, k):
+        """
+        Copy the solver to search alongside other copies. The copy starts
+        from the simulations of this iteration and has its own oracle
+        rng and sprn, each 'k' jumps ahead of those of the solver.
+
+        Parameters
+        ----------
+        k : int
+    Index of the fork
+
+    Returns
+    -------
+    RASolver
+
+    Notes
+    -----
+    The copy adds its simulations on top of those of the solver, which
+    are not copied. Speculative hits are not shared. With crn, which
+    they require, a fork simulating such a point gets the same values.
+        """
+        solver = copy(self)
+        solver.gbar = ChainMap(dict(), self.gbar)
+        solver.sehat = ChainMap(dict(), self.sehat)
+        solver.gstats = ChainMap(dict(), self.gstats)
+        solver.gstats_nu = ChainMap(dict(), self.gstats_nu)
+        solver.spec_hits = dict()
+        solver.num_calls = 0
+        solver.spec_calls = 0
+        solver.eps_times = dict()
+        solver.fork_pool = None
+        seed = self.orc.rng.get_seed()
+        if not self.orc.crnflag:
+            # every replication takes a substream, so 2^40 of them
+            # separate the forks
+            seed = get_stream_seed(seed, 0, k << 40)
+        solver.orc = self.orc.fork(seed)
+        solver.sprn = MRG32k3a(get_stream_seed(self.sprn.get_seed(), 0, k))
+        return solver
+
+    def detach(self):
+        """
+        Drop the simulations of the solver from those of a fork, keeping
+        those the fork added, e.g. before sending it back to the solver.
+        """
+        self.gbar = self.gbar.maps[0]
+        self.sehat = self.sehat.maps[0]
+        self.gstats = self.gstats.maps[0]
+        self.gstats_nu = self.gstats_nu.maps[0]
+
+    def merge(self, forks):
+        """
+        Add the simulations of forks to the solver. A point simulated by
+        several forks keeps the results of the first. The solver rngs
+        continue from those of the last fork, past the streams used by
+        every fork.
+
+        Parameters
+        ----------
+        forks : list of RASolver
+    Forks returned by 'fork', after 'detach'
+        """
+        spec_hits = self.spec_hits
+        for solver in forks:
+            for x in solver.gbar:
+                if x not in self.gbar:
+                    self.gbar[x] = solver.gbar[x]
+                    self.sehat[x] = solver.sehat[x]
+                    if x in solver.gstats:
+                        self.gstats[x] = solver.gstats[x]
+            self.gstats_nu.update(solver.gstats_nu)
+            for x in solver.spec_hits:
+                spec_hits.setdefault(x, solver.spec_hits[x])
+            self.num_calls += solver.num_calls
+            self.spec_calls += solver.spec_calls
+        self.spec_hits = {x: spec_hits[x] for x in spec_hits if x not in self.gbar}
+        self.orc.rewind(forks[-1].orc.rng.getstate())
+        self.sprn.setstate(forks[-1].sprn.getstate())
+
+    def eps_windows(self, a1new, windows, k_opt, k_con):
+        """
+        Search every epsilon window of P-Epsilon for constrained
+        minimizers. The wall time of every window is kept in
+        'eps_times'.
+
+        If 'epspar' is 0, every window continues from the streams and
+        simulations of the previous one. Otherwise, every window runs on
+        its own fork of the solver with 'run_forks', at once in
+        'epspar' processes if it is larger than 1.
+
+        Parameters
+        ----------
+        a1new : set of tuple of int
+    Points from which to start the searches
+    windows : list of tuple of float
+    The (lower, upper) bounds on objective 'k_con' of every window
+    k_opt : int
+    Index of the objective to minimize
+    k_con : int
+    Index of the objective to constrain
+
+    Returns
+    -------
+    mcAeps : set of tuple of int
+    The minimizers found in every window
+
+    Notes
+    -----
+    Sub-classes calling this must implement 'fse'. Window j uses the
+    streams of 'fork(j)' whatever the number of processes, so the
+    results are the same for every positive 'epspar'. They differ from
+    those with 'epspar' 0.
+        """
+        if self.epspar and windows:
+            argslist = [(a1new, epL, ep, k_opt, k_con) for epL, ep in windows]
+            res = self.run_forks('eps_window', argslist, self.epspar)
+        else:
+            res = []
+            for epL, ep in windows:
+                t0 = perf_counter()
+                mcA = self.eps_window(a1new, epL, ep, k_opt, k_con)
+                res.append((mcA, perf_counter() - t0))
+        self.eps_times[self.nu] = [t for _, t in res]
+        mcAeps = set()
+        for mcA, _ in res:
+            mcAeps |= mcA
+        return mcAeps
+
+    def eps_window(self, a1new, epL, ep, k_opt, k_con):
+        """
+        Repeatedly search for a minimizer of objective 'k_opt' under a
+        constraint on objective 'k_con', tightening the constraint from
+        'ep' until it is below 'epL'.
+
+        Parameters
+        ----------
+        a1new : set of tuple of int
+    Points from which to start the searches
+    epL : float
+    Lower bound of the window
+    ep : float
+    Upper bound of the window
+    k_opt : int
+    Index of the objective to minimize
+    k_con : int
+    Index of the objective to constrain
+
+    Returns
+    -------
+    mcA : set of tuple of int
+    The minimizers found in the window
+        """
+        epnew = ep
+        mcA = set()
+        mcT = set()
+        while epL < epnew:
+            stpts = {x: self.gbar[x] for x in a1new | mcT if self.gbar[x][k_con] <= epnew}
+            tbx0 = min(stpts, key=lambda t: self.gbar[t][k_opt])
+            mcTp, xst, fxst, sexst = self.spline(tbx0, epnew, k_opt, k_con)
+            mcA |= {xst}
+            mcT |= mcTp
+            back_dist = self.fse(sexst[k_con])
+            if back_dist == 0.0:
+                back_dist = 0.000001
+            epnew = fxst[k_con] - back_dist
+        return mcA
+
     def ne(self, x, fx, sex, nobj, e=float('inf'), kcon=0):
         """
         Finds a neighborhood point with an objective value smaller than
@@ -361,6 +1360,8 @@ class RASolver(MOSOSolver):
     sexs : tuple of float
     Standard errors of 'fxs'
         """
+        if self.specne and not self.reuse:
+            return self.spec_ne(x, fx, sex, nobj, e, kcon)
         q = self.dim
         m = self.m
         n = 0
@@ -404,6 +1405,59 @@ class RASolver(MOSOSolver):
                         break
         return xs, fxs, vxs, n
 
+    def spec_ne(self, x, fx, sex, nobj, e=float('inf'), kcon=0):
+        """
+        Like 'ne', but simulates the neighbors 'specne' at a time with
+        'speculate', e.g. in parallel. Returns the same neighbor as
+        'ne', and the replications of the neighbors after it count in
+        'spec_calls' rather than 'num_calls'.
+
+        Parameters
+        ----------
+        x : tuple of int
+        fx : tuple of float
+        sex : tuple of float
+        nobj : int
+        e : float
+        kcon : int
+    Same as in 'ne'
+
+    Returns
+    -------
+    Same as 'ne'
+        """
+        q = self.dim
+        m = self.m
+        n = 0
+        # list the neighbors in the order of 'ne'
+        if self.nbor_rad == 1:
+            nbors = []
+            for i in range(q):
+                nbors.append(tuple(x[j] + 1 if i == j else x[j] for j in range(q)))
+                nbors.append(tuple(x[j] - 1 if i == j else x[j] for j in range(q)))
+        else:
+            nbors = list(get_nbors(x, self.nbor_rad))
+        k = self.specne
+        for i in range(0, len(nbors), k):
+            batch = nbors[i:i + k]
+            state = self.orc.rng.getstate()
+            hits, states = self.speculate(batch)
+            for nb in batch:
+                if nb in hits:
+                    state = states.get(nb, state)
+                    isfeas, fn, sen = self.commit(nb, hits.pop(nb), e, kcon)
+                else:
+                    isfeas, fn, sen = self.estimate(nb, e, kcon)
+                if isfeas:
+                    n += m
+                    if fn[nobj] < fx[nobj]:
+                        # continue as if the rest were never simulated
+                        if hits:
+                            self.orc.rewind(state)
+                            self.discard(hits)
+                        return nb, fn, sen, n
+        return x, fx, sex, n
+
     def pli(self, x, e, nobj, kcon):
         """
         Generate a convex hull and construct a pseudo-gradient
@@ -450,11 +1504,11 @@ class RASolver(MOSOSolver):
         ghat = {}
         xbest = None
         fxbest = None
+        est = self.estimate_many(simp)
         for i in range(q + 1):
-            isfeas, fx, vx = self.estimate(simp[i])
+            isfeas, fx, vx = est[simp[i]]
             if isfeas:
-                isfeas2, fx, vx = self.estimate(simp[i], e, kcon)
-                if isfeas2:
+                if fx[kcon] <= e:
                     if not xbest:
                             xbest = simp[i]
                             fxbest = fx
@@ -561,88 +1615,165 @@ class RASolver(MOSOSolver):
 
     def estimate(self, x, con=float('inf'), nobj=0):
         """
-        Wraps simulation calls, updates the number of simulation calls,
-        performs feasibility checks, and stores the resulting objective
-        values.
+        Wraps simulation calls, updates the number of simulation calls,
+        performs feasibility checks, and stores the resulting objective
+        values.
+
+        Parameters
+        ----------
+        x : tuple of int
+    Point to simulate
+    con : float
+    Constraint value to check feasibility, default is
+    float('inf') i.e. unconstrained
+    nobj : int
+    Index of objective to minimize, default is 0, takes values
+    in {0, 1, ..., len('x') -1}
+
+    Returns
+    -------
+    isfeas : bool
+    True if 'fx' < 'e' and 'x' is feasible to the simulation
+    fx : tuple of float
+    Objective values of 'x'
+    vx : tuple of float
+    Standard errors of 'fx'
+        """
+        m = self.m
+        #first, check if x has already been sampled in this iteration
+        if x in self.gbar:
+            isfeas = True
+            fx = self.gbar[x]
+            vx = self.sehat[x]
+        elif x in self.spec_hits:
+            return self.commit(x, self.pop_spec_hit(x), con, nobj)
+        #if not, perform sampling
+        else:
+            #print('in: ', self.orc.rng.get_seed())
+            if self.reuse:
+                isfeas, fx, vx, mnew = self.call_orc(self.rehit, x, m)
+            else:
+                isfeas, fx, vx = self.call_orc(self.orc.hit, x, m)
+                mnew = m
+            if isfeas:
+                #print('out: ', self.orc.rng.get_seed())
+                self.num_calls += mnew
+                self.gbar[x] = fx
+                self.sehat[x] = vx
+        #next, check feasibility against the constraint which may be different
+        # than oracle feasibility
+        if isfeas:
+            if fx[nobj] > con:
+                isfeas = False
+        return isfeas, fx, vx
+
+    def call_orc(self, func, *args):
+        """
+        Call a function which simulates 'orc' and abort with a message if
+        the simulation fails.
+
+        Parameters
+        ----------
+        func : function
+    Function to call, e.g. 'orc.hit'
+    args : tuple
+    Arguments of 'func'
+
+    Returns
+    -------
+    The return value of 'func'
+        """
+        try:
+            return func(*args)
+        except TypeError:
+            print('--* Error: Unable to simulate ', type(self.orc).__name__, '. ')
+            print('--* Message: ', sys.exc_info()[1])
+            print('--* Ensure the g signature is g(self, x, rng). ')
+            print('--* Ensure isfeas, (obj1, obj2, ...) is returned. ')
+            print('--* Aborting. ')
+            sys.exit()
+        except ZeroDivisionError:
+            print('--* Error: Unable to simulate ', type(self.orc).__name__, '. ')
+            print('--* Message: ', sys.exc_info()[1])
+            print('--* Aborting. ')
+            sys.exit()
+        except ValueError:
+            print('--* Error: Unable to simulate ', type(self.orc).__name__, '. ')
+            print('--* Message: ', sys.exc_info()[1])
+            print('--* Ensure the g signature is g(self, x, rng). ')
+            print('--* Ensure isfeas, (obj1, obj2, ...) is returned. ')
+            print('--* Aborting. ')
+            sys.exit()
+        except AttributeError:
+            print('--* Error: Unable to simulate ', type(self.orc).__name__, '. ')
+            print('--* Message: ', sys.exc_info()[1])
+            print('--* Are you missing an import?')
+            print('--* Aborting. ')
+            sys.exit()
+        except IndexError:
+            print('--* Error: Unable to simulate ', type(self.orc).__name__, '. ')
+            print('--* Message: ', sys.exc_info()[1])
+            print('--* Ensure len(obj1, obj2, ..) == num_obj')
+            print('--* Aborting. ')
+            sys.exit()
+        except:
+            print('--* Error: Unable to simulate ', type(self.orc).__name__, '. ')
+            print('--* Message: ', sys.exc_info()[1])
+            print('--* Aborting. ')
+            sys.exit()
+
+    def rehit(self, x, m):
+        """
+        Estimate a point at sample size 'm', simulating only the
+        replications it lacks from previous iterations.
 
         Parameters
         ----------
         x : tuple of int
     Point to simulate
-    con : float
-    Constraint value to check feasibility, default is
-    float('inf') i.e. unconstrained
-    nobj : int
-    Index of objective to minimize, default is 0, takes values
-    in {0, 1, ..., len('x') -1}
+    m : int
+    Sample size
 
     Returns
     -------
     isfeas : bool
-    True if 'fx' < 'e' and 'x' is feasible to the simulation
     fx : tuple of float
-    Objective values of 'x'
     vx : tuple of float
-    Standard errors of 'fx'
+    Same as 'Oracle.hit'
+    mnew : int
+    The number of new replications simulated
         """
-        m = self.m
-        #first, check if x has already been sampled in this iteration
-        if x in self.gbar:
-            isfeas = True
-            fx = self.gbar[x]
-            vx = self.sehat[x]
-        #if not, perform sampling
+        n, obmean, obm2 = self.gstats.get(x, (0, [], []))
+        mnew = m - n
+        if mnew > 0:
+            isfeas, nn, nmean, nm2 = self.orc.moments(x, mnew, n)
+            if not isfeas:
+                return False, [], [], mnew
+            if n:
+                n, obmean, obm2 = merge_moments(n, obmean, obm2, nn, nmean, nm2)
+            else:
+                n, obmean, obm2 = nn, nmean, nm2
+            self.gstats[x] = (n, obmean, obm2)
         else:
-            #print('in: ', self.orc.rng.get_seed())
-            try:
-                isfeas, fx, vx = self.orc.hit(x, m)
-            except TypeError:
-                print('--* Error: Unable to simulate ', type(self.orc).__name__, '. ')
-                print('--* Message: ', sys.exc_info()[1])
-                print('--* Ensure the g signature is g(self, x, rng). ')
-                print('--* Ensure isfeas, (obj1, obj2, ...) is returned. ')
-                print('--* Aborting. ')
-                sys.exit()
-            except ZeroDivisionError:
-                print('--* Error: Unable to simulate ', type(self.orc).__name__, '. ')
-                print('--* Message: ', sys.exc_info()[1])
-                print('--* Aborting. ')
-                sys.exit()
-            except ValueError:
-                print('--* Error: Unable to simulate ', type(self.orc).__name__, '. ')
-                print('--* Message: ', sys.exc_info()[1])
-                print('--* Ensure the g signature is g(self, x, rng). ')
-                print('--* Ensure isfeas, (obj1, obj2, ...) is returned. ')
-                print('--* Aborting. ')
-                sys.exit()
-            except AttributeError:
-                print('--* Error: Unable to simulate ', type(self.orc).__name__, '. ')
-                print('--* Message: ', sys.exc_info()[1])
-                print('--* Are you missing an import?')
-                print('--* Aborting. ')
-                sys.exit()
-            except IndexError:
-                print('--* Error: Unable to simulate ', type(self.orc).__name__, '. ')
-                print('--* Message: ', sys.exc_info()[1])
-                print('--* Ensure len(obj1, obj2, ..) == num_obj')
-                print('--* Aborting. ')
-                sys.exit()
-            except:
-                print('--* Error: Unable to simulate ', type(self.orc).__name__, '. ')
-                print('--* Message: ', sys.exc_info()[1])
-                print('--* Aborting. ')
-                sys.exit()
-            if isfeas:
-                #print('out: ', self.orc.rng.get_seed())
-                self.num_calls += m
-                self.gbar[x] = fx
-                self.sehat[x] = vx
-        #next, check feasibility against the constraint which may be different
-        # than oracle feasibility
-        if isfeas:
-            if fx[nobj] > con:
-                isfeas = False
-        return isfeas, fx, vx
+            mnew = 0
+        self.gstats_nu[x] = self.nu
+        fx = tuple(obmean)
+        if n > 1:
+            vx = tuple([sqrt(o/(n - 1)/n) for o in obm2])
+        else:
+            vx = tuple([0 for o in obm2])
+        return True, fx, vx, mnew
+
+    def prune_gstats(self):
+        """
+        Remove the points of gstats which were not estimated in the last
+        'reuse_age' iterations. A removed point simulated again starts
+        from zero replications.
+        """
+        old = [x for x, nu in self.gstats_nu.items() if self.nu - nu > self.reuse_age]
+        for x in old:
+            del self.gstats_nu[x]
+            self.gstats.pop(x, None)
 
     # def spsolve(self, warm_start):
     #     """Solve a sample path problem. Implement this in the child class."""
@@ -664,12 +1795,139 @@ class RASolver(MOSOSolver):
     Subset of 'mcS' which are feasible
         """
         outset = set()
+        est = self.estimate_many(mcS)
         for s in mcS:
-            isfeas, fs, ses = self.estimate(s)
+            isfeas, fs, ses = est[s]
             if isfeas:
                 outset |= {s}
         return outset
 
+    def estimate_many(self, mcS):
+        """
+        Estimate several points like 'estimate', simulating the points
+        not yet sampled in this iteration all at once with
+        'orc.hit_many'.
+
+        Parameters
+        ----------
+        mcS : set or list of tuple of int
+    Points to simulate, in the order 'estimate' would if a list
+
+    Returns
+    -------
+    dict
+    Dictionary of {tuple of int: tuple} mapping each point to its
+    output from 'estimate'
+        """
+        est = dict()
+        if not self.reuse:
+            hits, states = self.speculate(mcS)
+            for x in hits:
+                est[x] = self.commit(x, hits[x])
+        for x in mcS:
+            if x not in est:
+                est[x] = self.estimate(x)
+        return est
+
+    def speculate(self, xs):
+        """
+        Simulate the points of 'xs' not yet sampled in this iteration
+        all at once with 'orc.hit_many', without storing the results.
+
+        Parameters
+        ----------
+        xs : list of tuple of int
+    Points to simulate, in the order 'estimate' would
+
+    Returns
+    -------
+    hits : dict
+    Dictionary of {tuple of int: tuple} mapping the simulated points
+    to their output from 'orc.hit'
+    states : dict
+    Dictionary of {tuple of int: tuple of int} mapping the simulated
+    points to the oracle rng state after their replications
+        """
+        m = self.m
+        hits = dict()
+        states = dict()
+        xnew = []
+        for x in xs:
+            if x in self.gbar or x in hits:
+                continue
+            if x in self.spec_hits:
+                hits[x] = self.pop_spec_hit(x)
+            else:
+                xnew.append(x)
+        if xnew:
+            xhits, xstates = self.call_orc(self.orc.hit_many, xnew, m)
+            hits.update(zip(xnew, xhits))
+            states.update(zip(xnew, xstates))
+        return hits, states
+
+    def commit(self, x, hit, con=float('inf'), nobj=0):
+        """
+        Store the output of 'orc.hit' at a point as 'estimate' would.
+
+        Parameters
+        ----------
+        x : tuple of int
+    Point simulated
+    hit : tuple
+    Output of 'orc.hit' at 'x'
+    con : float
+    nobj : int
+    Same as in 'estimate'
+
+    Returns
+    -------
+    tuple
+    Same as 'estimate'
+        """
+        isfeas, fx, vx = hit
+        if isfeas:
+            self.num_calls += self.m
+            self.gbar[x] = fx
+            self.sehat[x] = vx
+            if fx[nobj] > con:
+                isfeas = False
+        return isfeas, fx, vx
+
+    def pop_spec_hit(self, x):
+        """
+        Take back a result kept by 'discard'. With crn, every hit in an
+        iteration uses the same replications, so it equals a new hit.
+
+        Parameters
+        ----------
+        x : tuple of int
+
+        Returns
+        -------
+        tuple
+    Output of 'orc.hit' at 'x'
+        """
+        hit = self.spec_hits.pop(x)
+        if hit[0]:
+            self.spec_calls -= self.m
+        return hit
+
+    def discard(self, hits):
+        """
+        Record the unused results of 'speculate' and, with crn, keep them
+        for the rest of the iteration.
+
+        Parameters
+        ----------
+        hits : dict
+    Dictionary of {tuple of int: tuple} as returned by 'speculate'
+        """
+        for x in hits:
+            if hits[x][0]:
+                self.spec_calls += self.m
+            if self.orc.crnflag:
+                self.spec_hits[x] = hits[x]
+
     def calc_m(self, nu):
         """
         Compute the iteration sample size
@@ -729,19 +1987,10 @@ class RASolver(MOSOSolver):
             print('--* Aborting. ')
             sys.exit()
         r = self.nbor_rad
-        lwepset = set()
-        domset = set()
-        delz = [0]*self.num_obj
         nbors = get_setnbors(mcS, r)
-        nbors = self.upsample(nbors)
-        tmpd = {x: self.gbar[x] for x in mcS | nbors}
-        for s in mcS:
-            islwep, dompts = is_lwep(s, r, tmpd)
-            if islwep:
-                lwepset |= {s}
-            else:
-                domset |= dompts
-        return lwepset, domset
+        self.upsample(nbors)
+        # gbar now holds every feasible neighbor of mcS
+        return get_lweps(mcS, r, self.gbar)
 
 
 class RLESolver(RASolver):
@@ -778,6 +2027,49 @@ class RLESolver(RASolver):
     sehat : dict
     Like gbar, but maps feasible points to standard errors of
     the objective values.
+    reuse : bool
+    If True, keep the replications of every point across iterations
+    and only simulate the extra replications each iteration needs.
+    Default is False.
+    gstats : dict
+    Dictionary of {tuple of int: tuple} mapping feasible points to
+    their number of replications and the means and sums of squared
+    deviations of their objective values. Used when reuse is True.
+    It keeps every visited point, i.e. about 1 + 2*num_obj floats per
+    point, unless reuse_age is positive.
+    reuse_age : int
+    If positive, the number of iterations after its last estimate
+    that a point is kept in gstats. Default is 0, kept for the run.
+    gstats_nu : dict
+    Dictionary of {tuple of int: int} mapping the points of gstats to
+    the last iteration in which they were estimated
+    specne : int
+    If positive, the number of neighbors 'ne' simulates at once.
+    Default is 0, one at a time. Ignored when reuse is True.
+    spec_hits : dict
+    Like gbar, but maps points simulated ahead of need and not yet
+    used to the output of orc.hit. Only kept with crn.
+    spec_calls : int
+    The number of calls to orc.g simulated ahead of need and not
+    counted in num_calls
+    objpar : int
+    If larger than 1, the number of processes with which 'get_min'
+    runs the spline of every objective at once, each on its own fork
+    of the solver. The results are the same for every objpar larger
+    than 1, but differ from those with 0 or 1. Default is 0, every
+    spline continues from the previous one.
+    epspar : int
+    If positive, 'eps_windows' searches every epsilon window on its
+    own fork of the solver, at once in epspar processes if it is
+    larger than 1. The results are the same for every positive
+    epspar, but differ from those with 0. Default is 0, every window
+    continues from the previous one.
+    eps_times : dict
+    Dictionary of {iteration int : list of float} of the wall time in
+    seconds of every epsilon window searched in 'eps_windows'
+    fork_pool : multiprocessing.Pool object or None
+    The processes of objpar and epspar, started when first needed
+    and terminated at the end of 'solve'
     m : int
     Iteration sample size which is automatically updated
     b : int
@@ -890,7 +2182,8 @@ class RLESolver(RASolver):
         #     print('--* Is x0 feasible?')
         #     print('--* Aborting. ')
         #     sys.exit()
-        mcS = get_nondom(tmp)
+        archive = ParetoArchive(tmp)
+        mcS = archive.nondom(tmp)
         mcNnc = self.get_ncn(mcS)
         while n <= b and mcNnc:
             old_calls = self.num_calls
@@ -901,8 +2194,9 @@ class RLESolver(RASolver):
             if not mcNw:
                 mcXw = self.seek_lwep(mcNd, mcS)
                 mcS |= mcXw
-            tmp = {s: self.gbar[s] for s in mcS | {self.x0}}
-            mcS = get_nondom(tmp)
+            # x0 is already in or dominated in the archive
+            archive.update({s: self.gbar[s] for s in mcS if s not in archive})
+            mcS = archive.nondom(mcS | {self.x0})
             old_calls = self.num_calls
             mcNnc = self.get_ncn(mcS)
             ncncalls = self.num_calls - old_calls
@@ -925,60 +2219,37 @@ class RLESolver(RASolver):
         """
         # initialize the non-conforming neighborhood
         ncn = set()
-        #nisdom = set()
         d = self.num_obj
         r = self.nbor_rad
         dr = range(d)
         delN = get_setnbors(mcS, r)
-        delzero = tuple(0 for i in dr)
         # defintion 9 (a) -- check for strict domination in the deleted nbors
         for s in mcS:
             fs = self.gbar[s]
-            ses = self.sehat[s]
-            #dels = tuple(self.calc_delta(ses[i]) for i in dr)
-            snb = get_nbors(s, r) - mcS
-            for x in snb:
+            snb = []
+            fxs = []
+            for x in get_nbors(s, r) - mcS:
                 isfeas, fx, sex = self.estimate(x)
                 if isfeas:
-                    #delx = tuple(self.calc_delta(sex[i]) for i in dr)
-                    if does_strict_dominate(fx, fs, delzero, delzero):
-                        ncn |= {x}
-                    # if does_strict_dominate(fs, fx, delzero, delzero):
-                    #     nisdom |= {x}
-        # definition 9 (b) initialization
+                    snb.append(x)
+                    fxs.append(fx)
+            mask = dominance_mask(fs, fxs, kind='strict', reverse=True)
+            ncn |= {x for x, isdom in zip(snb, mask) if isdom}
+        # definition 9 (b) for every feasible deleted neighbor at once
+        mcN = []
+        fxs = []
+        delxs = []
         for x in delN - ncn:
             isfeas, fx, sex = self.estimate(x)
             if isfeas:
-                # definition 9 (b) (i) initialization
-                notweakdom = True
-                # definition 9 (b) (ii) initialization
-                notrelaxdom = True
-                # definition 9 (b) (iii) initialization
-                wouldnotchange = True
-                doesweakdom = False
-                # set the relaxation of the neighbor
-                delx = tuple(self.calc_delta(sex[i]) for i in dr)
-                for s in mcS:
-                    fs = self.gbar[s]
-                    ses = self.sehat[s]
-                    if does_weak_dominate(fx, fs, delzero, delzero):
-                        doesweakdom = True
-                for s in mcS:
-                    fs = self.gbar[s]
-                    ses = self.sehat[s]
-                    # set the relaxation of the LES candidate member
-                    dels = tuple(self.calc_delta(ses[i]) for i in dr)
-                    # definition 9 (b) (i)
-                    if does_weak_dominate(fs, fx, delzero, delzero):
-                        notweakdom = False
-                    # definition 9 (b) (ii)
-                    if does_dominate(fx, fs, delzero, delzero) and does_weak_dominate(fs, fx, dels, delx):
-                        notrelaxdom = False
-                    # definition 9 (b) (iii)
-                    if does_weak_dominate(fs, fx, dels, delx) or does_weak_dominate(fx, fs, delx, dels):
-                        wouldnotchange = False
-                # definition 9 (b)
-                if notweakdom and notrelaxdom and (doesweakdom or wouldnotchange):
+                mcN.append(x)
+                fxs.append(fx)
+                delxs.append(tuple(self.calc_delta(sex[i]) for i in dr))
+        if mcN:
+            fss = [self.gbar[s] for s in mcS]
+            delss = [tuple(self.calc_delta(self.sehat[s][i]) for i in dr) for s in mcS]
+            for x, isncn in zip(mcN, ncn_mask(fxs, delxs, fss, delss)):
+                if isncn:
                     ncn |= {x}
         return ncn
 
@@ -1041,8 +2312,7 @@ class Oracle(object):
     pseudo-random number generator used by the Oracle to simulate
     objective values at feasible points
     crnold_state : tuple
-    Tuple of length 2. The first item is a tuple of int, which is
-    an mrg32k3a seed. The second is random.Random state.
+    The rng state, i.e. a tuple of int, which is an mrg32k3a seed.
     crn_obsold : tuple
     Like crnold_state
     crnflag : bool
@@ -1050,6 +2320,9 @@ class Oracle(object):
     Defaults to off.
     simpar : int
     Number of processes to use when doing simulations. Defaults to 1
+    executor : Executor
+    Simulates the replications, serially or with simpar threads or
+    processes. Defaults to serial
     dim : int
     Number of dimensions of feasible points
     num_obj : int
@@ -1065,39 +2338,43 @@ class Oracle(object):
         self.rng = rng
         self.crnold_state = rng.getstate()
         self.crnflag = False
+        self.simpar = 1
+        self.executor = SerialExecutor(self)
         self.crn_obsold = rng.getstate()
+        self.crn_chkpts = [self.crnold_state]
         super().__init__()
 
 
-    def set_simpar(self, simpar):
+    def set_simpar(self, simpar, simexec='processes'):
         """
-        Intialize processes when parallel replications is enabled.
+        Intialize the executor of the replications, and its threads or
+        processes when parallel replications is enabled.
 
         Parameters
         ----------
         simpar : int
             Number of processes to use when performing simulation replications.
+        simexec : str
+            Name of the executor, one of 'serial', 'threads', or
+            'processes'. Default is 'processes'
         """
         self.simpar = simpar
+        if simexec not in executors:
+            print('--* Error: simexec must be one of ', ', '.join(executors), '. ')
+            print('--* Aborting. ')
+            sys.exit()
         if self.simpar > 1:
-            self.req_q = Queue()
-            self.res_q = Queue()
-            self.proc = []
-            for i in range(self.simpar):
-                p = Process(target=mp_worker, args=(self.req_q, self.res_q))
-                p.start()
-                self.proc.append(p)
+            self.executor = executors[simexec](self, simpar)
+        else:
+            self.executor = SerialExecutor(self)
 
 
     def mp_cleanup(self):
         """
-        Terminate all multiprocessing processes created in `__init__`. Call
+        Terminate all threads or processes created in `set_simpar`. Call
         this after simulation is complete.
         """
-        if self.simpar > 1:
-            for p in self.proc:
-                p.terminate()
-                p.join()
+        self.executor.shutdown()
 
 
     def set_crnflag(self, crnflag):
@@ -1135,13 +2412,19 @@ class Oracle(object):
         Jump ahead to the new crn baseline, and set the new rewind point
         """
         self.crn_check()
-        self.rng = get_next_prnstream(self.rng.get_seed(), self.crnflag)
+        oldrng = self.rng
+        self.rng = get_next_prnstream(oldrng.get_seed(), False)
+        if self.crnflag:
+            # keep the cache and its statistics, but not the old stream
+            cache = getattr(oldrng, 'cache', None)
+            if cache is not None:
+                cache.cache_clear()
+                self.rng.set_cache(cache)
+            else:
+                self.rng.set_class_cache(True)
         new_oldstate = self.rng.getstate()
         self.set_crnold(new_oldstate)
         self.crn_obsold = new_oldstate
-        if self.crnflag:
-            self.rng.generate.cache_clear()
-            self.rng.bsm.cache_clear()
 
     def crn_check(self):
         '''
@@ -1166,6 +2449,81 @@ class Oracle(object):
         jump_substream(self.rng)
         self.crn_setobs()
 
+    def crn_substream(self, n):
+        '''
+        Return the seed of substream 'n' of the crn baseline, i.e. the
+        seed after 'n' replications from 'crnold_state'.
+
+        Parameters
+        ----------
+        n : int
+
+        Returns
+        -------
+        tuple of int
+        '''
+        # keep every 64th seed to bound both the memory and the jumps
+        chkpts = self.crn_chkpts
+        if not chkpts[0] == self.crnold_state:
+            chkpts = [self.crnold_state]
+            self.crn_chkpts = chkpts
+        while len(chkpts) <= n//64:
+            seed = chkpts[-1]
+            for i in range(64):
+                seed = jump_seed(seed, a1p76, a2p76)
+            chkpts.append(seed)
+        seed = chkpts[n//64]
+        for i in range(n % 64):
+            seed = jump_seed(seed, a1p76, a2p76)
+        return seed
+
+    def crn_streams(self, m):
+        '''
+        Return the seeds of the substreams of the next 'm' replications
+        and jump past them, as 'm' replications followed by 'crn_nextobs'
+        would.
+
+        Parameters
+        ----------
+        m : int
+    number of replications
+
+        Returns
+        -------
+        streams : list of tuple of int
+    mrg32k3a seeds from which to simulate each replication
+        '''
+        streams = [self.rng.get_seed()]
+        seed = self.crn_obsold
+        for i in range(m):
+            seed = jump_seed(seed, a1p76, a2p76)
+            streams.append(seed)
+        self.rng.setstate(streams.pop())
+        self.crn_setobs()
+        return streams
+
+    def replicate(self, x, m):
+        """
+        Simulate 'm' replications at 'x' on consecutive substreams
+        using 'executor'. Serially, use 'g_batch' if the oracle
+        implements it for its 'g', and 'g' otherwise.
+
+        Parameters
+        ----------
+        x : tuple of int
+    point at which to simulate
+    m : int
+    number of replications to simulate 'x'
+
+        Yields
+        -------
+        tuple
+    'm' pairs of the feasibility and objective values returned by
+    'g', one at a time so that callers can consume them in one
+    pass. Consume all 'm' before using the oracle again.
+        """
+        yield from self.executor.replicate(self, x, m)
+
     def bump(self, x, m):
         """
         Simulate 'm' replications at 'x' and return the replication
@@ -1196,13 +2554,10 @@ class Oracle(object):
             print('--* Aborting. ')
             sys.exit()
         else:
-            mr = range(m)
             feas = []
-            for i in mr:
-                oisfeas, objd = self.g(x, self.rng)
+            for oisfeas, objd in self.replicate(x, m):
                 feas.append(oisfeas)
                 obs.append(objd)
-                self.crn_nextobs()
             if all(feas):
                 isfeas = True
         self.crn_check()
@@ -1230,51 +2585,172 @@ class Oracle(object):
     mean of standard errors of each objective of 'm' simulations
         """
 
-        d = self.num_obj
-        dr = range(d)
-        isfeas = False
+        dr = range(self.num_obj)
         obmean = []
         obse = []
-        mr = range(m)
         assert(m >= 1)
         if m == 1:
-            isfeas, objd = self.g(x, self.rng)
+            [(isfeas, objd)] = self.replicate(x, 1)
             obmean = objd
             obse = [0 for o in objd]
-            self.crn_nextobs()
+            self.crn_check()
         else:
-            feas = []
-            objm = []
-            # take replications in parallel
-            if self.simpar > 1:
-                for i in mr:
-                    # we will reconstruct objects within `mp_replicate` and then
-                    # compute the replications in parallel
-                    orccls = type(self)
-                    rngcls = type(self.rng)
-                    cseed = self.rng.get_seed()
-                    proc_job = (mp_replicate, (orccls, x, rngcls, cseed))
-                    self.req_q.put(proc_job)
-                    self.crn_nextobs()
-                for i in mr:
-                    # block until parallel results are ready
-                    isfeasi, oval = self.res_q.get()
-                    feas.append(isfeasi)
-                    objm.append(oval)
-            # do not take replications in parallel
+            isfeas, n, obm, obm2 = self.moments(x, m)
+            if isfeas:
+                obmean = tuple(obm)
+                obse = tuple([sqrt(obm2[k]/(m - 1)/m) for k in dr])
+        return isfeas, obmean, obse
+
+    def hit_many(self, xs, m):
+        """
+        Generate the means and standard errors of 'm' replications at
+        each point of 'xs', simulating the replications of all points
+        at once with the executor. The results equal those of calling
+        'hit' on each point in order.
+
+        Parameters
+        ----------
+        xs : list of tuple of int
+    points at which to simulate
+    m : int
+    number of replications to simulate each point
+
+        Returns
+        -------
+        hits : list of tuple
+    triples of isfeas, obmean, and obse as returned by 'hit'
+        states : list of tuple
+    the rng state after the replications of each point, from which
+    'rewind' continues as if only the points up to it were hit
+        """
+        dr = range(self.num_obj)
+        jobs = []
+        states = []
+        for x in xs:
+            jobs.append((x, self.crn_streams(m)))
+            self.crn_check()
+            states.append(self.rng.getstate())
+        reps = self.executor.run(self, jobs)
+        if states:
+            self.rewind(states[-1])
+        hits = []
+        for repx in reps:
+            obmean = []
+            obse = []
+            if m == 1:
+                [(isfeas, obmean)] = repx
+                obse = [0 for o in obmean]
             else:
-                for i in mr:
-                    isfeasi, oval = self.g(x, self.rng)
-                    feas.append(isfeasi)
-                    objm.append(oval)
-                    self.crn_nextobs()
-            if all(feas):
-                isfeas = True
-                obmean = tuple([mean([objm[i][k] for i in mr]) for k in dr])
-                obvar = [variance([objm[i][k] for i in mr], obmean[k]) for k in dr]
-                obse = tuple([sqrt(obvar[i]/m) for i in dr])
+                isfeas, n, obm, obm2 = get_moments(repx, self.num_obj)
+                if isfeas:
+                    obmean = tuple(obm)
+                    obse = tuple([sqrt(obm2[k]/(m - 1)/m) for k in dr])
+            hits.append((isfeas, obmean, obse))
+        return hits, states
+
+    def fork(self, seed):
+        """
+        Copy the oracle to simulate from another stream. The copy has its
+        own rng, started from 'seed', and shares the other attributes,
+        including the executor.
+
+        Parameters
+        ----------
+        seed : tuple of int
+
+        Returns
+        -------
+        Oracle
+        """
+        # copy the attributes directly, since copy would use __getstate__
+        orc = type(self).__new__(type(self))
+        orc.__dict__.update(self.__dict__)
+        orc.rng = type(self.rng)(seed)
+        cache = getattr(self.rng, 'cache', None)
+        if cache is not None:
+            orc.rng.set_class_cache(True, cache.maxsize)
+        orc.crn_obsold = seed
+        orc.crn_chkpts = list(self.crn_chkpts)
+        return orc
+
+    def __getstate__(self):
+        """
+        Return the attributes to pickle, e.g. to send a fork to a process
+        of objpar or epspar. The rng is sent as its seed, without the
+        uniforms it caches. The executor holds threads or processes, so
+        it is not sent and the unpickled oracle simulates serially.
+
+        Returns
+        -------
+        dict
+        """
+        state = dict(self.__dict__)
+        cache = getattr(self.rng, 'cache', None)
+        maxsize = None if cache is None else cache.maxsize
+        state['rng'] = (type(self.rng), self.rng.get_seed(), maxsize)
+        del state['executor']
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restore the attributes returned by '__getstate__'.
+
+        Parameters
+        ----------
+        state : dict
+        """
+        rngcls, seed, maxsize = state.pop('rng')
+        self.__dict__.update(state)
+        self.rng = rngcls(seed)
+        if maxsize is not None:
+            self.rng.set_class_cache(True, maxsize)
+        self.executor = SerialExecutor(self)
+
+    def rewind(self, state):
+        """
+        Set the rng state, e.g. to one returned by 'hit_many', and the
+        intermediate crn rewind point with it.
+
+        Parameters
+        ----------
+        state : tuple of int
+        """
+        self.rng.setstate(state)
+        self.crn_setobs()
+
+    def moments(self, x, m, n0=0):
+        """
+        Generate the means and sums of squared deviations of 'm'
+        simulation replications at point 'x'. With crn, the
+        replications start from substream 'n0' of the crn baseline so
+        that they continue a previous call with 'n0' replications.
+
+        Parameters
+        ----------
+        x : tuple of int
+    point at which to simulate
+    m : int
+    number of replications to simulate 'x'
+    n0 : int
+    number of replications already taken at 'x', default is 0
+
+        Returns
+        -------
+        isfeas : bool
+    indicates the feasibility of 'x'
+        n : int
+    number of replications accumulated
+        obmean : list of float
+    mean of each objective of 'm' simulations
+        obm2 : list of float
+    sum of squared deviations of each objective of 'm' simulations
+        """
+        if self.crnflag and n0:
+            self.rng.setstate(self.crn_substream(n0))
+            self.crn_setobs()
+        res = get_moments(self.replicate(x, m), self.num_obj)
         self.crn_check()
-        return isfeas, obmean, obse
+        return res
 
     def g(self, x, rng):
         """
@@ -1285,6 +2761,83 @@ class Oracle(object):
         x : tuple
         rng : random.Random object
 
+        Returns
+        -------
+        bool
+            Indicates feasibility of `x`
+        tuple of float
+            The simulated values for each objective
+
+        Notes
+        -----
+        Sub-classes may also implement `g_batch(self, x, m, streams)`,
+        which simulates `m` replications at once. `streams` is a list of
+        `m` mrg32k3a seeds, and replication `i` must generate its random
+        numbers from `streams[i]` exactly as `g` would from an rng seeded
+        with it, without using `self.rng`. `g_batch` returns an iterable
+        of `m` pairs like the output of `g`.
+        """
+        raise NotImplementedError
+
+
+class AsyncOracle(Oracle):
+    """
+    Base class for oracles whose replications are awaited rather than
+    computed, e.g. requests to long-lived external simulators. Many
+    replications, of one or several points, are kept in flight at
+    once, up to 'concurrency'.
+
+    Attributes
+    ----------
+    concurrency : int
+    Maximum number of replications in flight. Defaults to 16, or to
+    simpar if it is larger than 1
+
+    Parameters
+    ----------
+    rng : prng.MRG32k3a object
+
+    See also
+    --------
+    Oracle
+
+    Notes
+    -----
+    Sub-classes implement the coroutine `g(self, x, rng)`, which must
+    only use its 'rng' argument, e.g. to seed the external simulator.
+    """
+
+    concurrency = 16
+
+    def __init__(self, rng):
+        super().__init__(rng)
+        self.executor = AsyncExecutor(self, self.concurrency)
+
+    def set_simpar(self, simpar, simexec='processes'):
+        """
+        Set the maximum number of replications in flight. An AsyncOracle
+        always uses its own executor, so 'simexec' is ignored.
+
+        Parameters
+        ----------
+        simpar : int
+            Maximum number of replications in flight if larger than 1
+        simexec : str
+        """
+        self.simpar = simpar
+        if simpar > 1:
+            self.concurrency = simpar
+            self.executor.num_workers = simpar
+
+    async def g(self, x, rng):
+        """
+        Generate a single replication at point `x`.
+
+        Parameters
+        ----------
+        x : tuple
+        rng : random.Random object
+
         Returns
         -------
         bool
@@ -1293,3 +2846,10 @@ class Oracle(object):
             The simulated values for each objective
         """
         raise NotImplementedError
+
+    async def close(self):
+        """
+        Release external resources, e.g. stop simulator processes. Called
+        by 'mp_cleanup'.
+        """
+        pass
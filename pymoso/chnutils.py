@@ -37,30 +37,69 @@ isp_run
 par_runs
 gen_metric
 par_diff
+get_metric_matrix
+get_frontier_metrics
 does_weak_dominate
 does_dominate
 does_strict_dominate
+dominance_mask
+dominance_matrix
 is_lep
 is_lwep
+get_lweps
 get_biparetos
+get_biparetos_ordered
 front
+sweep_front
+block_front
+kung_front
+kung_merge
 get_nondom
+ParetoArchive(object), class
+SortedFront(object), class
+NDNode(object), class
+NDTree(object), class
+get_stencil
 get_nbors
 argsort
 get_setnbors
+get_setnbors_array
 enorm
 perturb
 edist
 dxB
 dAB
 dH
+HausdorffRef(object), class
+HausdorffRefs(object), class
+sq_dists
+points_array
+point_tuples
+KDNode(object), class
+KDTree(object), class
 """
 
-from itertools import product, filterfalse
-from math import ceil, floor, sqrt
+from itertools import product
+from bisect import bisect_left, bisect_right
+from math import floor, sqrt
+from operator import add, eq, le, lt
 import multiprocessing as mp
-from statistics import mean, variance
-from .prng.mrg32k3a import MRG32k3a, get_next_prnstream
+from .prng.mrg32k3a import MRG32k3a, get_next_prnstream, get_stream_seed, get_stream_seeds
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# number of points from which get_nondom compares blocks with numpy
+nondom_block_min = 256
+# number of points from which get_nondom uses kung_front even with numpy,
+# since block_front compares every block to all non-dominated values
+nondom_kung_min = 10000
+# neighborhood offsets of every (dimension, radius) used by get_stencil
+nbor_stencils = dict()
+# number of pairs of points up to which HausdorffRef compares every
+# pair with numpy rather than search a KDTree
+haus_pairs_max = 1 << 18
 
 
 def solve(problem, solver, x0, **kwargs):
@@ -85,20 +124,19 @@ def solve(problem, solver, x0, **kwargs):
     budget = kwargs.pop('budget')
     seed = kwargs.pop('seed')
     simpar = kwargs.pop('simpar')
+    simexec = kwargs.pop('simexec', 'processes')
     crn = kwargs.pop('crn')
     paramtups = []
     for i, p in enumerate(kwargs):
         ptup = (p, float(kwargs[p]))
         paramtups.append(ptup)
     ## generate all prn streams
-    solvstream = MRG32k3a(seed)
-    orcstream = get_next_prnstream(seed, crn)
     orcstream, solvstream = get_solv_prnstreams(seed, crn)
     ## generate the experiment list
     paramlst = [('solvprn', solvstream), ('x0', x0), ]
     orc = problem(orcstream)
     orc.set_crnflag(crn)
-    orc.set_simpar(simpar)
+    orc.set_simpar(simpar, simexec)
     ## create arguments for (unknown) optional named parameters
     if paramtups:
         paramlst.extend(paramtups)
@@ -136,11 +174,12 @@ def testsolve(tester, solver, x0, **kwargs):
     proc = kwargs.pop('proc')
     ranx0 = kwargs.pop('ranx0')
     crn = kwargs.pop('crn')
+    indexed = kwargs.pop('indexed', False)
     paramtups = []
     for i, p in enumerate(kwargs):
         ptup = (p, float(kwargs[p]))
         paramtups.append(ptup)
-    orcstreams, solvstreams, x0stream, endseed = get_testsolve_prnstreams(isp, seed, crn)
+    orcstreams, solvstreams, x0stream, endseed = get_testsolve_prnstreams(isp, seed, crn, indexed)
     joblist = []
     currtest = tester()
     orclst = []
@@ -164,7 +203,7 @@ def testsolve(tester, solver, x0, **kwargs):
     return res, endseed
 
 
-def get_testsolve_prnstreams(num_trials, iseed, crn):
+def get_testsolve_prnstreams(num_trials, iseed, crn, indexed=False):
     """
     Create the set of random number stream generators with which to test
     a MOSO algorithm.
@@ -178,6 +217,11 @@ def get_testsolve_prnstreams(num_trials, iseed, crn):
         Starting seed from which to create the generators
     crn : bool
         Indicate whether CRN is on or off
+    indexed : bool, optional
+        If True, seed stream t + 1 for the solver of trial t and a block
+        of 201 streams per oracle, each computed directly from iseed.
+        The streams differ from the default chained layout, so results
+        for a given seed change. Default False.
 
     Returns
     -------
@@ -191,6 +235,17 @@ def get_testsolve_prnstreams(num_trials, iseed, crn):
     max_RI = 200
     orcprn_lst = []
     solprn_lst = []
+    if indexed:
+        for sseed in get_stream_seeds(iseed, 1, num_trials):
+            solprn = MRG32k3a(sseed)
+            solprn.set_class_cache(False)
+            solprn_lst.append(solprn)
+        for oseed in get_stream_seeds(iseed, num_trials + 1, num_trials, max_RI + 1):
+            orcprn = MRG32k3a(oseed)
+            orcprn.set_class_cache(crn)
+            orcprn_lst.append(orcprn)
+        iseed = get_stream_seed(iseed, num_trials + num_trials*(max_RI + 1))
+        return orcprn_lst, solprn_lst, xprn, iseed
     for t in range(num_trials):
         solprn = get_next_prnstream(iseed, False)
         iseed = solprn.get_seed()
@@ -348,14 +403,76 @@ def gen_metric(rundat, tester):
         number, number of calls, and metric values.
     """
     met_data = {}
-    for nu in rundat['itersoln']:
-        les_nu = rundat['itersoln'][nu]
+    mets = get_metric_matrix([rundat], tester)[0]
+    for nu, met_nu in zip(rundat['itersoln'], mets):
         calls_nu = rundat['simcalls'][nu]
-        met_nu = tester.metric(les_nu)
         met_data[nu] = (nu, calls_nu, met_nu)
     return met_data
 
 
+def get_metric_matrix(rundata, tester):
+    """
+    Compute the metrics of every iteration of many sample path runs.
+
+    Parameters
+    ----------
+    rundata : list of dict
+        Ouputs of chnbase.MOSOSolver.solve calls
+    tester
+        Instantiated object such that 'tester.metric' is callable
+
+    Returns
+    -------
+    metmat : list of list
+        metmat[i][j] is the metric of the j-th iteration of rundata[i],
+        in the order of rundata[i]['itersoln']
+
+    Notes
+    -----
+    If 'tester.metric_batch' is callable, it takes the solutions of
+    every iteration of a run in one call and returns their metrics.
+    """
+    metric_batch = getattr(tester, 'metric_batch', None)
+    metmat = []
+    for rundat in rundata:
+        elesets = [rundat['itersoln'][nu] for nu in rundat['itersoln']]
+        if metric_batch is None:
+            metmat.append([tester.metric(eles) for eles in elesets])
+        else:
+            metmat.append(metric_batch(elesets))
+    return metmat
+
+
+def get_frontier_metrics(elesets, true_g, dist):
+    """
+    Compute the metrics of many simulated solutions, such as every
+    iteration of a run, computing 'true_g' once per point.
+
+    Parameters
+    ----------
+    elesets : list of set of tuple of numbers
+        Simulated solutions
+    true_g : function
+        Returns the true objective values of a point
+    dist : function
+        Returns the metric of a list of true objective values
+
+    Returns
+    -------
+    mets : list of float
+        mets[i] is the metric of elesets[i]
+    """
+    objs = dict()
+    mets = []
+    for eles in elesets:
+        for point in eles:
+            if point not in objs:
+                objs[point] = true_g(point)
+        efrontier = [objs[point] for point in eles]
+        mets.append(dist(efrontier))
+    return mets
+
+
 def par_diff(rundata, tester, num_proc):
     """
     Compute metrics in parallel.
@@ -376,16 +493,22 @@ def par_diff(rundata, tester, num_proc):
     """
     NUM_PROCESSES = num_proc
     num_isp = len(rundata)
+    runs = [rundata[i] for i in range(num_isp)]
+    # each process computes the metric matrix of every
+    # NUM_PROCESSES-th run in one job
     joblist = []
-    for i in range(num_isp):
-        joblist.append((rundata[i], tester))
-    hddict = dict()
+    for k in range(min(NUM_PROCESSES, num_isp)):
+        joblist.append((runs[k::NUM_PROCESSES], tester))
+    metmat = [None]*num_isp
     with mp.Pool(NUM_PROCESSES) as p:
-        worklist = [(gen_metric, (e)) for e in joblist]
+        worklist = [(get_metric_matrix, (e)) for e in joblist]
         app_rd = [p.apply_async(do_work, job) for job in worklist]
-        for i, r in enumerate(app_rd):
-            myitem = r.get()
-            hddict[i] = myitem
+        for k, r in enumerate(app_rd):
+            metmat[k::NUM_PROCESSES] = r.get()
+    hddict = dict()
+    for i in range(num_isp):
+        rundat = runs[i]
+        hddict[i] = {nu: (nu, rundat['simcalls'][nu], met_nu) for nu, met_nu in zip(rundat['itersoln'], metmat[i])}
     return hddict
 
 
@@ -481,6 +604,114 @@ def does_strict_dominate(g1, g2, delta1, delta2):
     return is_sdom
 
 
+def dominance_mask(g, objs, delta=None, dels=None, kind='dom', reverse=False):
+    """
+    Compare one objective value to many with does_weak_dominate,
+    does_dominate, or does_strict_dominate.
+
+    Parameters
+    ----------
+    g : tuple of float
+        Objective values of a point
+    objs : list of tuple of float
+        Objective values of points
+    delta : tuple of float, optional
+        Relaxation of 'g', default is no relaxation
+    dels : list of tuple of float, optional
+        Relaxations of 'objs', default is no relaxation
+    kind : str, optional
+        'weak', 'dom', or 'strict', default is 'dom'
+    reverse : bool, optional
+        If True, compare every value of 'objs' to 'g' instead
+
+    Returns
+    -------
+    mask : list of bool
+        mask[j] is True if 'g' dominates objs[j] or, with 'reverse', if
+        objs[j] dominates 'g'
+    """
+    # relax the dominating values down and the dominated values up
+    if delta is not None:
+        if reverse:
+            g = [a + b for a, b in zip(g, delta)]
+        else:
+            g = [a - b for a, b in zip(g, delta)]
+    if dels is not None:
+        if reverse:
+            objs = [[a - b for a, b in zip(h, d)] for h, d in zip(objs, dels)]
+        else:
+            objs = [[a + b for a, b in zip(h, d)] for h, d in zip(objs, dels)]
+    # a value does not dominate another which is smaller, or not
+    # larger if strict, in some objective
+    fails = le if kind == 'strict' else lt
+    if kind == 'dom':
+        # does_dominate also excludes equal values
+        if reverse:
+            return [not (any(map(lt, g, h)) or all(map(eq, g, h))) for h in objs]
+        return [not (any(map(lt, h, g)) or all(map(eq, g, h))) for h in objs]
+    if reverse:
+        return [not any(map(fails, g, h)) for h in objs]
+    return [not any(map(fails, h, g)) for h in objs]
+
+
+def dominance_matrix(objs1, objs2, dels1=None, dels2=None, kind='dom'):
+    """
+    Compare many objective values to many with does_weak_dominate,
+    does_dominate, or does_strict_dominate, with numpy if it is
+    installed.
+
+    Parameters
+    ----------
+    objs1 : list of tuple of float
+        Objective values of points
+    objs2 : list of tuple of float
+        Objective values of points
+    dels1 : list of tuple of float, optional
+        Relaxations of 'objs1', default is no relaxation
+    dels2 : list of tuple of float, optional
+        Relaxations of 'objs2', default is no relaxation
+    kind : str, optional
+        'weak', 'dom', or 'strict', default is 'dom'
+
+    Returns
+    -------
+    mat : numpy.ndarray of bool, or list of list of bool
+        mat[i][j] is True if objs1[i] dominates objs2[j]. With numpy,
+        'mat' is an array of shape (len(objs1), len(objs2))
+
+    Notes
+    -----
+    With numpy, the arrays compared are of size len(objs1)*len(objs2),
+    so callers should split very large sets.
+    """
+    if np is None:
+        if dels2 is not None:
+            objs2 = [[a + b for a, b in zip(h, d)] for h, d in zip(objs2, dels2)]
+        if dels1 is None:
+            dels1 = [None]*len(objs1)
+        return [dominance_mask(g, objs2, d, kind=kind) for g, d in zip(objs1, dels1)]
+    lo = np.array(objs1, dtype=float)
+    hi = np.array(objs2, dtype=float)
+    if not lo.size or not hi.size:
+        return np.zeros((len(lo), len(hi)), dtype=bool)
+    if dels1 is not None:
+        lo = lo - np.array(dels1, dtype=float).reshape(lo.shape)
+    if dels2 is not None:
+        hi = hi + np.array(dels2, dtype=float).reshape(hi.shape)
+    shape = (len(lo), len(hi))
+    # 'notdom' if hi < lo, or hi <= lo if strict, in some objective
+    notdom = np.zeros(shape, dtype=bool)
+    iseq = np.ones(shape, dtype=bool) if kind == 'dom' else None
+    cmp = np.less_equal if kind == 'strict' else np.less
+    for k in range(lo.shape[1]):
+        notdom |= cmp(hi[None, :, k], lo[:, None, k])
+        if iseq is not None:
+            iseq &= lo[:, None, k] == hi[None, :, k]
+    if iseq is not None:
+        notdom |= iseq
+    return ~notdom
+
+
 def is_lep(x, r, gdict):
     """
     Return true if x is a LEP
@@ -498,17 +729,9 @@ def is_lep(x, r, gdict):
     -------
     bool
     """
-    dim = len(x)
-    nbors = get_nbors(x, r)
-    dominated = False
-    delz = [0]*dim
     fx = gdict[x]
-    for n in nbors:
-        if n in gdict:
-            fn = gdict[n]
-            if does_dominate(fn, fx, delz, delz):
-                dominated = True
-    return not dominated
+    fns = [gdict[n] for n in get_nbors(x, r) if n in gdict]
+    return not any(dominance_mask(fx, fns, reverse=True))
 
 
 def is_lwep(x, r, gdict):
@@ -530,19 +753,48 @@ def is_lwep(x, r, gdict):
     domset : set of tuple of int
         Set of points which strictly dominate 'x'
     """
-    dim = len(gdict[x])
-    nbors = get_nbors(x, r)
-    dominated = False
-    delz = [0]*dim
-    fx = gdict[x]
+    lwepset, domset = get_lweps({x}, r, gdict)
+    return bool(lwepset), domset
+
+
+def get_lweps(mcS, r, gdict):
+    """
+    Find the LWEPs of a set, i.e. 'is_lwep' for every point at once.
+
+    Parameters
+    ----------
+    mcS : set of tuple of int
+        Feasible points
+    r : float
+        Radius for which to consider neighbors
+    gdict : dict
+        Objective values for every point of 'mcS' and its neighbors
+
+    Returns
+    -------
+    lwepset : set of tuple of int
+        Subset of 'mcS' which are LWEPs
+    domset : set of tuple of int
+        Set of points which strictly dominate a point of 'mcS'
+    """
+    lwepset = set()
     domset = set()
-    for n in nbors:
-        if n in gdict:
-            fn = gdict[n]
-            if does_strict_dominate(fn, fx, delz, delz):
-                dominated = True
-                domset |= {n}
-    return not dominated, domset
+    for x in mcS:
+        nbors = [tuple(map(add, x, o)) for o in get_stencil(len(x), r)]
+        nbors = [n for n in nbors if n in gdict]
+        mask = dominance_mask(gdict[x], [gdict[n] for n in nbors], kind='strict', reverse=True)
+        dom = {n for n, isdom in zip(nbors, mask) if isdom}
+        if dom:
+            # grow the sets like 'is_lwep' over 'get_nbors', since the
+            # solvers break ties in the order of iteration over them
+            dompts = set()
+            for n in get_nbors(x, r):
+                if n in dom:
+                    dompts |= {n}
+            domset |= dompts
+        else:
+            lwepset |= {x}
+    return lwepset, domset
 
 
 def get_biparetos(edict):
@@ -560,30 +812,48 @@ def get_biparetos(edict):
     plist : set of tuple of int
         Set of non-dominated points
     """
+    # grow the set one point at a time like earlier versions, since the
+    # solvers break ties in the order of iteration over it
+    plist = set()
+    for x in get_biparetos_ordered(edict):
+        plist |= {x}
+    return plist
+
+
+def get_biparetos_ordered(edict):
+    """
+    Generate the non-dominated points of a set with two objectives in
+    increasing order of the first objective, i.e. decreasing order of
+    the second.
+
+    Of the points with equal objective values, only the first in
+    'edict' is kept.
+
+    Parameters
+    ----------
+    edict : dict
+        Keys are feasible points (tuples of int), values are objective
+         values (tuples of float) of length 2
+
+    Returns
+    -------
+    plist : list of tuple of int
+        List of non-dominated points
+    """
     pts = list(edict.keys())
     vals = list(edict.values())
+    if len(pts) < 2:
+        return pts
     sind = argsort(vals)
-    g2 = 1
-    dlen = len(pts)
-    plist = set()
-    if dlen > 1:
-        i = 0
-        j = 0
-        while j < dlen:
-            is_pareto = False
-            bkey = pts[sind[i]]
-            plist |= {bkey}
-            j = i + 1
-            #print('i: ', i, ' j: ', j, ' bkey: ', bkey, ' len: ', dlen)
-            while not is_pareto and j < dlen:
-                newp = pts[sind[j]]
-                if edict[bkey][g2] > edict[newp][g2]:
-                    is_pareto = True
-                    i = j
-                else:
-                    j += 1
-    else:
-        plist |= set(pts)
+    g2 = [vals[i][1] for i in sind]
+    # after the first, keep every point which improves the second
+    # objective of the points kept so far
+    plist = [pts[sind[0]]]
+    best = g2[0]
+    for k in range(1, len(sind)):
+        if g2[k] < best:
+            plist.append(pts[sind[k]])
+            best = g2[k]
     return plist
 
 
@@ -610,21 +880,206 @@ def front(points, objs):
         halfind = int(cardP/2)
         Tpts, Tobjs = front(points[0:halfind], objs[0:halfind])
         Bpts, Bobjs = front(points[halfind:cardP], objs[halfind:cardP])
-        brange = range(len(Bpts))
-        for i in brange:
-            pt = Bpts[i]
-            gvals = Bobjs[i]
-            delz = [0]*len(gvals)
-            pt_nondom = True
-            j = 0
-            while j < len(Tpts) and pt_nondom:
-                if does_dominate(Tobjs[j], gvals, delz, delz):
-                    pt_nondom = False
-                j += 1
-            if pt_nondom:
-                Tpts.append(pt)
-                Tobjs.append(gvals)
-        return Tpts, Tobjs
+        # points of the bottom front do not dominate each other, so
+        # drop those which a point of the top front dominates
+        for gvals in Tobjs:
+            mask = dominance_mask(gvals, Bobjs)
+            if any(mask):
+                Bpts = [pt for pt, isdom in zip(Bpts, mask) if not isdom]
+                Bobjs = [gb for gb, isdom in zip(Bobjs, mask) if not isdom]
+                if not Bpts:
+                    break
+        return Tpts + Bpts, Tobjs + Bobjs
+
+
+def sweep_front(objs):
+    """
+    Generate the non-dominated objective values of one or two objectives
+    in a single sweep.
+
+    Parameters
+    ----------
+    objs : list of tuple of float
+        Objective values sorted in increasing lexicographic order
+
+    Returns
+    -------
+    keep : list of int
+        Indices of the non-dominated values in 'objs'
+    """
+    keep = []
+    # smallest last objective among the values sorted before the current
+    best = float('inf')
+    prev = None
+    for i, g in enumerate(objs):
+        if not g == prev:
+            if prev is not None and prev[-1] < best:
+                best = prev[-1]
+            prev = g
+        if g[-1] < best:
+            keep.append(i)
+    return keep
+
+
+def block_front(objs, size=256):
+    """
+    Generate the non-dominated objective values by comparing blocks of
+    values, with numpy, to the non-dominated values found so far.
+
+    Parameters
+    ----------
+    objs : list of tuple of float
+        Objective values sorted in increasing lexicographic order
+    size : int
+        Number of values in a block, default is 256
+
+    Returns
+    -------
+    keep : list of int
+        Indices of the non-dominated values in 'objs'
+    """
+    g = np.asarray(objs, dtype=float)
+    n = len(g)
+    nondom = np.empty_like(g)
+    nf = 0
+    keep = []
+    for s in range(0, n, size):
+        blk = g[s:s + size]
+        ind = np.arange(s, s + len(blk))
+        # only values sorted before a value can dominate it, so compare
+        # the block to the values kept so far and then to itself
+        for t in range(0, nf, 4*size):
+            u = min(t + 4*size, nf)
+            dom = dominance_matrix(nondom[t:u], blk).any(axis=0)
+            blk, ind = blk[~dom], ind[~dom]
+        dom = dominance_matrix(blk, blk).any(axis=0)
+        blk, ind = blk[~dom], ind[~dom]
+        nondom[nf:nf + len(blk)] = blk
+        nf += len(blk)
+        keep.extend(ind.tolist())
+    return keep
+
+
+def kung_front(objs):
+    """
+    Generate the non-dominated objective values with Kung's divide and
+    conquer algorithm.
+
+    Parameters
+    ----------
+    objs : list of tuple of float
+        Objective values sorted in increasing lexicographic order
+
+    Returns
+    -------
+    keep : list of int
+        Indices of the non-dominated values in 'objs'
+
+    Notes
+    -----
+    Equal values are kept or dropped together, so the algorithm runs on
+    the distinct values. The front of the first half of the values
+    can dominate the second half but not the reverse, and since the
+    first objective is already in order, the second half is filtered
+    with 'kung_merge' on the remaining objectives.
+    """
+    if not objs:
+        return []
+    # the first index of every distinct value
+    first = [0]
+    for i in range(1, len(objs)):
+        if not objs[i] == objs[i - 1]:
+            first.append(i)
+    uvals = [objs[i] for i in first]
+    isdom = [False]*len(uvals)
+
+    def kung(ind):
+        if len(ind) < 2:
+            return ind
+        half = len(ind)//2
+        tops = kung(ind[:half])
+        bots = kung(ind[half:])
+        kung_merge(uvals, tops, bots, 1, isdom)
+        return tops + [b for b in bots if not isdom[b]]
+
+    kept = kung(list(range(len(uvals))))
+    first.append(len(objs))
+    keep = []
+    for u in kept:
+        keep.extend(range(first[u], first[u + 1]))
+    return keep
+
+
+def kung_merge(objs, tops, bots, k, isdom):
+    """
+    Mark the values of 'bots' for which a value of 'tops' is no larger
+    in every objective from 'k' on.
+
+    Parameters
+    ----------
+    objs : list of tuple of float
+        Objective values
+    tops : list of int
+        Indices of the values which may dominate
+    bots : list of int
+        Indices of the values to mark
+    k : int
+        Index of the first objective to compare
+    isdom : list of bool
+        Set to True at the indices of 'bots' which are marked
+
+    Notes
+    -----
+    Two objectives are swept in order of the first. More objectives
+    are divided at the median of objective 'k'. The lower values of
+    'tops' then dominate the upper values of 'bots' in objective 'k',
+    which drops it from that comparison. Few pairs are compared one by
+    one.
+    """
+    bots = [b for b in bots if not isdom[b]]
+    if not tops or not bots:
+        return
+    d = len(objs[bots[0]])
+    if k == d or len(tops)*len(bots) <= 64:
+        for b in bots:
+            gb = objs[b][k:]
+            for t in tops:
+                if all(map(le, objs[t][k:], gb)):
+                    isdom[b] = True
+                    break
+    elif k == d - 1:
+        best = min(objs[t][k] for t in tops)
+        for b in bots:
+            if best <= objs[b][k]:
+                isdom[b] = True
+    elif k == d - 2:
+        # values of 'tops' come first among equal values of objective k
+        order = sorted([(objs[t][k], 0, t) for t in tops] + [(objs[b][k], 1, b) for b in bots])
+        best = float('inf')
+        for gk, isbot, i in order:
+            if isbot:
+                if best <= objs[i][k + 1]:
+                    isdom[i] = True
+            elif objs[i][k + 1] < best:
+                best = objs[i][k + 1]
+    else:
+        vals = sorted(objs[i][k] for i in tops + bots)
+        med = vals[len(vals)//2]
+        if vals[0] < med:
+            islow = lambda i: objs[i][k] < med
+        elif med < vals[-1]:
+            islow = lambda i: objs[i][k] <= med
+        else:
+            # objective k is equal everywhere
+            kung_merge(objs, tops, bots, k + 1, isdom)
+            return
+        tlow = [t for t in tops if islow(t)]
+        thigh = [t for t in tops if not islow(t)]
+        blow = [b for b in bots if islow(b)]
+        bhigh = [b for b in bots if not islow(b)]
+        kung_merge(objs, tlow, blow, k, isdom)
+        kung_merge(objs, thigh, bhigh, k, isdom)
+        kung_merge(objs, tlow, bhigh, k + 1, isdom)
 
 
 def get_nondom(edict):
@@ -641,6 +1096,13 @@ def get_nondom(edict):
     -------
     set
         Set of non-dominated points
+
+    Notes
+    -----
+    Up to two objectives are swept with 'sweep_front'. More objectives
+    are divided and conquered with 'kung_front' or, with numpy and from
+    'nondom_block_min' up to 'nondom_kung_min' points, compared in
+    blocks with 'block_front'. scripts/bench_nondom.py times them.
     """
     pts = list(edict.keys())
     vals = list(edict.values())
@@ -650,8 +1112,419 @@ def get_nondom(edict):
     for i in range(len(pts)):
         newpts.append(pts[sind[i]])
         newvals.append(vals[sind[i]])
-    Mpts, Mobjs = front(newpts, newvals)
-    return set(Mpts)
+    if not newvals:
+        return set()
+    if len(newvals[0]) <= 2:
+        return {newpts[i] for i in sweep_front(newvals)}
+    if np is not None and nondom_block_min <= len(newvals) < nondom_kung_min:
+        return {newpts[i] for i in block_front(newvals)}
+    return {newpts[i] for i in kung_front(newvals)}
+
+
+class ParetoArchive(object):
+    """
+    Keep the non-dominated points of a set up to date as points are
+    inserted and deleted.
+
+    Values of one or two objectives are kept sorted on the first
+    objective, so a query bisects them. Values of more objectives are
+    kept in an ND-tree, i.e. a tree of nodes bounded by the ideal and
+    nadir values below them, and a query only visits the nodes whose
+    bounds allow a dominance relation.
+
+    Attributes
+    ----------
+    points : dict
+        Dictionary of {tuple of int: tuple of float} mapping the
+        non-dominated points to their objective values
+    unique : bool
+        If True, keep only the first point inserted with a value
+
+    Parameters
+    ----------
+    edict : dict, optional
+        Keys are feasible points (tuples of int), values are objective
+         values (tuples of float) to insert
+    unique : bool, optional
+        Default is False, i.e. keep every point with a non-dominated
+        value, like get_nondom
+
+    Notes
+    -----
+    Deleting a point does not restore the points it dominated.
+    """
+
+    def __init__(self, edict=None, unique=False):
+        self.points = dict()
+        self.unique = unique
+        self._buckets = dict()
+        self._front = None
+        if edict:
+            self.update(edict)
+        super().__init__()
+
+    def __len__(self):
+        return len(self.points)
+
+    def __contains__(self, x):
+        return x in self.points
+
+    def __iter__(self):
+        return iter(self.points)
+
+    def is_dominated(self, gx):
+        """
+        Return True if a point of the archive dominates a value.
+
+        Parameters
+        ----------
+        gx : tuple of float
+            Objective values
+
+        Returns
+        -------
+        bool
+        """
+        if self._front is None:
+            return False
+        return self._front.is_dominated(tuple(gx))
+
+    def insert(self, x, gx):
+        """
+        Insert a point unless it is dominated, and delete the points it
+        dominates.
+
+        Parameters
+        ----------
+        x : tuple of int
+        gx : tuple of float
+            Objective values of 'x'
+
+        Returns
+        -------
+        bool
+            True if 'x' is in the archive
+        """
+        if x in self.points:
+            return True
+        gx = tuple(gx)
+        if gx in self._buckets:
+            if self.unique:
+                return False
+            self._buckets[gx].append(x)
+            self.points[x] = gx
+            return True
+        if self._front is None:
+            if len(gx) <= 2:
+                self._front = SortedFront()
+            else:
+                self._front = NDTree(len(gx))
+        elif self._front.is_dominated(gx):
+            return False
+        for gy in self._front.remove_dominated(gx):
+            for y in self._buckets.pop(gy):
+                del self.points[y]
+        self._front.add(gx)
+        self._buckets[gx] = [x]
+        self.points[x] = gx
+        return True
+
+    def update(self, edict):
+        """
+        Insert every point of a dictionary.
+
+        Parameters
+        ----------
+        edict : dict
+            Keys are feasible points (tuples of int), values are
+             objective values (tuples of float)
+        """
+        for x in edict:
+            self.insert(x, edict[x])
+
+    def delete(self, x):
+        """
+        Delete a point if it is in the archive.
+
+        Parameters
+        ----------
+        x : tuple of int
+        """
+        gx = self.points.pop(x, None)
+        if gx is None:
+            return
+        bucket = self._buckets[gx]
+        bucket.remove(x)
+        if not bucket:
+            del self._buckets[gx]
+            self._front.discard(gx)
+
+    def nondom(self, order=None):
+        """
+        Return the points of the archive.
+
+        Parameters
+        ----------
+        order : iterable of tuple of int, optional
+            Points in the order of the keys of a dictionary given to
+            get_nondom. Default is None, i.e. the order of insertion
+
+        Returns
+        -------
+        set
+            Set of non-dominated points, built in increasing
+            lexicographic order of the values. Points of equal values
+            are added in 'order', so that the set equals get_nondom
+            over such a dictionary, iteration order included.
+        """
+        if self._front is None:
+            return set()
+        vals = self._front.values()
+        if order is None or all(len(self._buckets[gx]) == 1 for gx in vals):
+            return {x for gx in vals for x in self._buckets[gx]}
+        rank = {x: i for i, x in enumerate(order)}
+        last = len(rank)
+        return {x for gx in vals for x in sorted(self._buckets[gx], key=lambda y: rank.get(y, last))}
+
+
+class SortedFront(object):
+    """
+    Non-dominated values of one or two objectives, sorted in increasing
+    order of the first objective and thus decreasing order of the last.
+    Used by ParetoArchive.
+    """
+
+    def __init__(self):
+        self.first = []
+        self.vals = []
+        super().__init__()
+
+    def is_dominated(self, gx):
+        """Return True if a value other than 'gx' dominates 'gx'."""
+        # the last value whose first objective is not larger has the
+        # smallest last objective of all such values
+        j = bisect_right(self.first, gx[0]) - 1
+        return j >= 0 and not self.vals[j] == gx and self.vals[j][-1] <= gx[-1]
+
+    def remove_dominated(self, gx):
+        """Remove and return the values 'gx' dominates."""
+        # the values dominated by gx follow it while their last
+        # objective is not smaller
+        lo = bisect_left(self.first, gx[0])
+        hi = lo
+        while hi < len(self.vals) and self.vals[hi][-1] >= gx[-1]:
+            hi += 1
+        removed = self.vals[lo:hi]
+        del self.first[lo:hi]
+        del self.vals[lo:hi]
+        return removed
+
+    def add(self, gx):
+        """Add a value which no value dominates."""
+        lo = bisect_left(self.first, gx[0])
+        self.first.insert(lo, gx[0])
+        self.vals.insert(lo, gx)
+
+    def discard(self, gx):
+        """Remove a value."""
+        i = bisect_left(self.first, gx[0])
+        del self.first[i]
+        del self.vals[i]
+
+    def values(self):
+        """Return the values in increasing lexicographic order."""
+        return list(self.vals)
+
+
+class NDNode(object):
+    """
+    Node of an NDTree. A leaf holds values, other nodes hold children.
+    """
+    __slots__ = ('ideal', 'nadir', 'vals', 'children')
+
+    def __init__(self, vals=None, children=None):
+        self.vals = vals
+        self.children = children
+        self.bound()
+
+    def bound(self):
+        """Compute the ideal and nadir values of the node."""
+        if self.vals is not None:
+            los = his = self.vals
+        else:
+            los = [c.ideal for c in self.children]
+            his = [c.nadir for c in self.children]
+        self.ideal = tuple(map(min, zip(*los)))
+        self.nadir = tuple(map(max, zip(*his)))
+
+    def midpoint_dist(self, gx):
+        """Return the squared distance from 'gx' to the middle of the node."""
+        return sum((g - (lo + hi)/2)**2 for g, lo, hi in zip(gx, self.ideal, self.nadir))
+
+
+class NDTree(object):
+    """
+    Non-dominated values of three or more objectives in an ND-tree, see
+    A. Jaszkiewicz and T. Lust, ``ND-Tree-Based Update: A Fast Algorithm
+    for the Dynamic Nondominance Problem'', IEEE Transactions on
+    Evolutionary Computation, 22, 5 (2018), 778--791. Used by
+    ParetoArchive.
+
+    Parameters
+    ----------
+    num_obj : int
+        Number of objectives
+    leaf_size : int
+        Number of values above which a leaf is split, default is 20
+    """
+
+    def __init__(self, num_obj, leaf_size=20):
+        self.num_obj = num_obj
+        self.leaf_size = leaf_size
+        self.root = None
+        super().__init__()
+
+    def is_dominated(self, gx):
+        """Return True if a value other than 'gx' dominates 'gx'."""
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            if not all(lo <= g for lo, g in zip(node.ideal, gx)):
+                continue
+            if all(hi <= g for hi, g in zip(node.nadir, gx)) and not node.nadir == gx:
+                return True
+            if node.vals is not None:
+                for v in node.vals:
+                    if not v == gx and all(a <= g for a, g in zip(v, gx)):
+                        return True
+            else:
+                stack.extend(node.children)
+        return False
+
+    def remove_dominated(self, gx):
+        """Remove and return the values 'gx' dominates."""
+        removed = []
+        if self.root and self.prune(self.root, gx, True, removed):
+            self.root = None
+        return removed
+
+    def discard(self, gx):
+        """Remove a value."""
+        if self.root and self.prune(self.root, gx, False, []):
+            self.root = None
+
+    def prune(self, node, gx, dominated, removed):
+        """
+        Remove the values of a subtree which 'gx' dominates, or else
+        which equal 'gx', and return True if the subtree is empty.
+        """
+        if dominated:
+            if not all(g <= hi for g, hi in zip(gx, node.nadir)):
+                return False
+            if all(g <= lo for g, lo in zip(gx, node.ideal)):
+                removed.extend(self.values(node))
+                return True
+        elif not all(lo <= g <= hi for g, lo, hi in zip(gx, node.ideal, node.nadir)):
+            return False
+        num = len(removed)
+        if node.vals is not None:
+            keep = []
+            for v in node.vals:
+                if (dominated and all(g <= a for g, a in zip(gx, v))) or v == gx:
+                    removed.append(v)
+                else:
+                    keep.append(v)
+            node.vals = keep
+            if not keep:
+                return True
+        else:
+            node.children = [c for c in node.children if not self.prune(c, gx, dominated, removed)]
+            if not node.children:
+                return True
+            if len(node.children) == 1:
+                child = node.children[0]
+                node.vals = child.vals
+                node.children = child.children
+        if len(removed) > num or not dominated:
+            node.bound()
+        return False
+
+    def add(self, gx):
+        """Add a value which no value dominates."""
+        if self.root is None:
+            self.root = NDNode(vals=[gx])
+            return
+        node = self.root
+        while True:
+            node.ideal = tuple(map(min, node.ideal, gx))
+            node.nadir = tuple(map(max, node.nadir, gx))
+            if node.vals is not None:
+                break
+            node = min(node.children, key=lambda c: c.midpoint_dist(gx))
+        node.vals.append(gx)
+        if len(node.vals) > self.leaf_size:
+            self.split(node)
+
+    def split(self, node):
+        """
+        Turn a leaf into num_obj + 1 leaves, seeded by values far apart.
+        """
+        vals = node.vals
+        def dist(a, b):
+            return sum((x - y)**2 for x, y in zip(a, b))
+        seeds = [max(vals, key=lambda v: sum(dist(v, w) for w in vals))]
+        rest = [v for v in vals if v is not seeds[0]]
+        while len(seeds) < self.num_obj + 1 and rest:
+            s = max(rest, key=lambda v: sum(dist(v, w) for w in seeds))
+            seeds.append(s)
+            rest.remove(s)
+        children = [NDNode(vals=[s]) for s in seeds]
+        for v in rest:
+            child = min(children, key=lambda c: c.midpoint_dist(v))
+            child.vals.append(v)
+            child.bound()
+        node.vals = None
+        node.children = children
+
+    def values(self, node=None):
+        """
+        Return the values of a subtree, or of the tree in increasing
+        lexicographic order.
+        """
+        if node is None:
+            if self.root is None:
+                return []
+            return sorted(self.values(self.root))
+        if node.vals is not None:
+            return list(node.vals)
+        return [v for c in node.children for v in self.values(c)]
+
+
+def get_stencil(q, r=1):
+    """
+    Find the offsets from a point of dimension 'q' to its neighbors,
+    computing them only the first time.
+
+    Parameters
+    ----------
+    q : int
+        Dimension of the points
+    r : int
+        radius of the neighborhood
+
+    Returns
+    -------
+    tuple of tuple of int
+        The non-zero integer offsets no farther than 'r' from zero, in
+        increasing lexicographic order
+    """
+    key = (q, r)
+    if key not in nbor_stencils:
+        rr = int(floor(r))
+        box = product(range(-rr, rr + 1), repeat=q)
+        zero = (0,)*q
+        nbor_stencils[key] = tuple(o for o in box if not o == zero and not edist(zero, o) > r)
+    return nbor_stencils[key]
 
 
 def get_nbors(x, r=1):
@@ -670,21 +1543,9 @@ def get_nbors(x, r=1):
     set of tuple of int
         The neighborhood of 'x'
     """
-    # define a filter function for points too far away
-    def edist_filter(x1):
-        # also filter the input point
-        if edist(x, x1) > r or x == x1:
-            return True
-    q = len(x)
-    # generate all points in a box with sides length 2r around x
-    bounds = []
-    for i in range(q):
-        a = int(ceil(x[i] - r))
-        b = int(floor(x[i] + r))
-        bounds.append(range(a, b+1))
-    boxpts = product(*bounds)
-    # remove those farther than r from x and return the list of neighbors
-    nbors = set(filterfalse(edist_filter, boxpts))
+    nbors = {tuple([a + b for a, b in zip(x, o)]) for o in get_stencil(len(x), r)}
+    # return a copy like earlier versions, since the solvers break ties
+    # in the order of iteration over it
     return set(nbors)
 
 
@@ -726,6 +1587,38 @@ def get_setnbors(mcs, r):
     return set_nbors - mcs
 
 
+def get_setnbors_array(mcs, r):
+    """
+    Generate the exclusive neighborhood of a set as an array, with
+    numpy.
+
+    Parameters
+    ----------
+    mcs : set of tuple of int
+        Set of points of equal dimension
+    r : float
+        Radius of neighborhood
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of int with a row for each point of the exclusive
+        neighborhood, in increasing lexicographic order
+    """
+    if np is None:
+        raise ImportError('get_setnbors_array requires numpy')
+    pts = np.array(sorted(mcs), dtype=np.int64)
+    if not len(pts):
+        return pts.reshape(0, 0)
+    q = pts.shape[1]
+    stencil = np.array(get_stencil(q, r), dtype=np.int64).reshape(-1, q)
+    nbors = np.unique((pts[:, None, :] + stencil[None, :, :]).reshape(-1, q), axis=0)
+    # compare whole rows as bytes to exclude the points of the set
+    row = np.dtype((np.void, 8*q))
+    isin = np.isin(nbors.view(row).ravel(), pts.view(row).ravel())
+    return nbors[~isin]
+
+
 def enorm(x):
     """
     Compute the norm of a vector.
@@ -785,12 +1678,14 @@ def dxB(x, B):
     Parameters
     ----------
     x : tuple of numbers
-    B : set of tuple of numbers
+    B : set of tuple of numbers, or HausdorffRef
 
     Returns
     -------
     dmin : float
     """
+    if isinstance(B, HausdorffRef):
+        return B.dxB(x)
     dmin = float('inf')
     for b in B:
         dxb = edist(x, b)
@@ -805,19 +1700,18 @@ def dAB(A, B):
 
     Parameters
     ----------
-    A : set of tuple of numbers
-    B : set of tuple of numbers
+    A : set of tuple of numbers, numpy.ndarray, or HausdorffRef
+    B : set of tuple of numbers, numpy.ndarray, or HausdorffRef
 
     Returns
     -------
     dmax : float
     """
-    dmax = float('-inf')
-    for a in A:
-        daB = dxB(a, B)
-        if daB > dmax:
-            dmax = daB
-    return dmax
+    if isinstance(A, HausdorffRef) and not isinstance(B, HausdorffRef):
+        return A.dBA(B)
+    if not isinstance(B, HausdorffRef):
+        B = HausdorffRef(B)
+    return B.dAB(A)
 
 
 def dh(A, B):
@@ -826,12 +1720,409 @@ def dh(A, B):
 
     Parameters
     ----------
-    A : set of tuple of numbers
-    B : set of tuple of numbers
+    A : set of tuple of numbers, numpy.ndarray, or HausdorffRef
+    B : set of tuple of numbers, numpy.ndarray, or HausdorffRef
 
     Returns
     -------
     float
         The Hausdorf distance
+
+    Notes
+    -----
+    To compute the distances from many sets to a fixed set, index the
+    fixed set once with HausdorffRef.
+    """
+    if isinstance(A, HausdorffRef) and not isinstance(B, HausdorffRef):
+        A, B = B, A
+    if not isinstance(B, HausdorffRef):
+        B = HausdorffRef(B)
+    return B.dh(A)
+
+
+class HausdorffRef(object):
+    """
+    Index a set of points, such as a reference frontier, for the
+    distances of dxB, dAB, and dh to other sets.
+
+    With numpy, the distances to another set are computed from every
+    pair of points in blocks, if there are at most 'haus_pairs_max'
+    pairs. Otherwise, the nearest points are found in a KDTree.
+
+    Attributes
+    ----------
+    points : list of tuple of float
+    array : numpy.ndarray or None
+        The points, if numpy is installed
+    tree : KDTree or None
+        The points, once a distance needs the tree
+
+    Parameters
+    ----------
+    B : set of tuple of numbers, or numpy.ndarray
+    """
+
+    def __init__(self, B):
+        self.points = point_tuples(B)
+        self.array = points_array(self.points) if np is not None else None
+        self.tree = None
+        super().__init__()
+
+    def __len__(self):
+        return len(self.points)
+
+    def get_tree(self):
+        """Return the KDTree of the points, built on the first call."""
+        if self.tree is None:
+            self.tree = KDTree(self.points)
+        return self.tree
+
+    def use_array(self, A):
+        """Return True if the distances to 'A' compare every pair."""
+        return self.array is not None and len(A)*len(self.points) <= haus_pairs_max
+
+    def sq_mins(self, A):
+        """
+        Compute, with numpy, the smallest squared distances from every
+        point of a set to the points and from every point to the set.
+
+        Parameters
+        ----------
+        A : set of tuple of numbers, numpy.ndarray, or HausdorffRef
+
+        Returns
+        -------
+        amins : numpy.ndarray
+            Squared distances from the points of 'A'
+        bmins : numpy.ndarray
+            Squared distances from the points
+        """
+        if isinstance(A, HausdorffRef):
+            a = A.array
+        else:
+            a = points_array(A)
+        b = self.array
+        amins = np.full(len(a), np.inf)
+        bmins = np.full(len(b), np.inf)
+        if not len(a) or not len(b):
+            return amins, bmins
+        # bound the size of the pairwise arrays
+        step = max(1, (1 << 20)//len(b))
+        for i in range(0, len(a), step):
+            sq = sq_dists(a[i:i + step], b)
+            amins[i:i + step] = sq.min(axis=1)
+            np.minimum(bmins, sq.min(axis=0), out=bmins)
+        return amins, bmins
+
+    def dxB(self, x):
+        """
+        Compute distance from a point to the points.
+
+        Parameters
+        ----------
+        x : tuple of numbers
+
+        Returns
+        -------
+        float
+        """
+        return self.dAB([x])
+
+    def dAB(self, A):
+        """
+        Compute distance from a set to the points.
+
+        Parameters
+        ----------
+        A : set of tuple of numbers, numpy.ndarray, or HausdorffRef
+
+        Returns
+        -------
+        float
+        """
+        if not len(A):
+            return float('-inf')
+        if self.use_array(A):
+            amins, bmins = self.sq_mins(A)
+            return sqrt(float(amins.max()))
+        apts = A.points if isinstance(A, HausdorffRef) else point_tuples(A)
+        return sqrt(self.get_tree().max_nearest_sq(apts))
+
+    def dBA(self, A):
+        """
+        Compute distance from the points to a set.
+
+        Parameters
+        ----------
+        A : set of tuple of numbers, numpy.ndarray, or HausdorffRef
+
+        Returns
+        -------
+        float
+        """
+        if not self.points:
+            return float('-inf')
+        if self.use_array(A):
+            amins, bmins = self.sq_mins(A)
+            return sqrt(float(bmins.max()))
+        atree = A.get_tree() if isinstance(A, HausdorffRef) else KDTree(A)
+        return sqrt(atree.max_nearest_sq(self.points))
+
+    def dh(self, A):
+        """
+        Compute the Hausdorf distance between a set and the points.
+
+        Parameters
+        ----------
+        A : set of tuple of numbers, numpy.ndarray, or HausdorffRef
+
+        Returns
+        -------
+        float
+        """
+        if not len(A) or not self.points:
+            return max(self.dAB(A), self.dBA(A))
+        if self.use_array(A):
+            amins, bmins = self.sq_mins(A)
+            return sqrt(max(float(amins.max()), float(bmins.max())))
+        apts = A.points if isinstance(A, HausdorffRef) else point_tuples(A)
+        atree = A.get_tree() if isinstance(A, HausdorffRef) else KDTree(apts)
+        # the second direction only matters where it exceeds the first
+        dmax = self.get_tree().max_nearest_sq(apts)
+        return sqrt(atree.max_nearest_sq(self.points, dmax))
+
+
+class HausdorffRefs(object):
+    """
+    Index a list of sets of points, such as the LES's of a tester, for
+    the Hausdorff distances from another set to all of them at once.
+
+    With numpy, the points of every set are stacked in one array and
+    the distances are computed from every pair in blocks. Otherwise,
+    every set is a HausdorffRef.
+
+    Attributes
+    ----------
+    refs : list of HausdorffRef
+    full : list of int
+        Indices of the non-empty sets
+    array : numpy.ndarray or None
+        The points of the non-empty sets, if numpy is installed
+    starts : numpy.ndarray or None
+        Row of 'array' of the first point of every non-empty set
+
+    Parameters
+    ----------
+    sets : list of set of tuple of numbers
     """
-    return max(dAB(A, B), dAB(B, A))
+
+    def __init__(self, sets):
+        self.refs = [HausdorffRef(B) for B in sets]
+        self.full = [k for k, ref in enumerate(self.refs) if len(ref)]
+        self.array = None
+        self.starts = None
+        if np is not None and self.full:
+            self.array = np.concatenate([self.refs[k].array for k in self.full])
+            lens = [len(self.refs[k]) for k in self.full]
+            self.starts = np.cumsum([0] + lens[:-1])
+        super().__init__()
+
+    def __len__(self):
+        return len(self.refs)
+
+    def dh(self, A):
+        """
+        Compute the Hausdorf distance between a set and every set.
+
+        Parameters
+        ----------
+        A : set of tuple of numbers, numpy.ndarray, or HausdorffRef
+
+        Returns
+        -------
+        dists : list of float
+            dists[k] is the Hausdorf distance between 'A' and the k-th
+            set
+        """
+        if self.array is None or not len(A):
+            if not isinstance(A, HausdorffRef):
+                A = HausdorffRef(A)
+            return [ref.dh(A) for ref in self.refs]
+        if isinstance(A, HausdorffRef):
+            a = A.array
+        else:
+            a = points_array(A)
+        b = self.array
+        # the farthest point of 'A' from every set, and the nearest
+        # point of 'A' to every point of the sets
+        amaxs = np.full(len(self.full), -np.inf)
+        bmins = np.full(len(b), np.inf)
+        step = max(1, (1 << 20)//len(b))
+        for i in range(0, len(a), step):
+            sq = sq_dists(a[i:i + step], b)
+            np.maximum(amaxs, np.minimum.reduceat(sq, self.starts, axis=1).max(axis=0), out=amaxs)
+            np.minimum(bmins, sq.min(axis=0), out=bmins)
+        bmaxs = np.maximum.reduceat(bmins, self.starts)
+        # the distance to an empty set is infinite
+        dists = [float('inf')]*len(self.refs)
+        for k, d in zip(self.full, np.sqrt(np.maximum(amaxs, bmaxs)).tolist()):
+            dists[k] = d
+        return dists
+
+
+def sq_dists(a, b):
+    """
+    Compute the squared distances of every pair of rows of two numpy
+    arrays, summed in the order of edist.
+
+    Parameters
+    ----------
+    a : numpy.ndarray
+    b : numpy.ndarray
+
+    Returns
+    -------
+    sq : numpy.ndarray
+        sq[i, j] is the squared distance from a[i] to b[j], or inf
+        instead of nan, since nan distances never count in dxB
+    """
+    sq = np.zeros((len(a), len(b)))
+    with np.errstate(invalid='ignore'):
+        for k in range(b.shape[1]):
+            sq += (a[:, None, k] - b[None, :, k])**2
+    sq[np.isnan(sq)] = np.inf
+    return sq
+
+
+def points_array(A):
+    """
+    Stack a set of points in a numpy array of floats with a row for
+    every point.
+
+    Parameters
+    ----------
+    A : set of tuple of numbers, or numpy.ndarray
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+    if isinstance(A, np.ndarray) and A.ndim == 2:
+        return A.astype(float, copy=False)
+    a = np.array([tuple(x) for x in A], dtype=float)
+    return a.reshape(len(a), -1) if len(a) else np.zeros((0, 0))
+
+
+def point_tuples(A):
+    """
+    List the points of a set as tuples of Python numbers.
+
+    Parameters
+    ----------
+    A : set of tuple of numbers, or numpy.ndarray
+
+    Returns
+    -------
+    list of tuple of numbers
+    """
+    if np is not None and isinstance(A, np.ndarray):
+        A = A.tolist()
+    return [tuple(x) for x in A]
+
+
+class KDNode(object):
+    """
+    Node of a KDTree. A leaf holds points, other nodes split theirs on
+    one coordinate.
+    """
+    __slots__ = ('axis', 'split', 'lo', 'hi', 'pts')
+
+    def __init__(self, axis=None, split=None, lo=None, hi=None, pts=None):
+        self.axis = axis
+        self.split = split
+        self.lo = lo
+        self.hi = hi
+        self.pts = pts
+
+
+class KDTree(object):
+    """
+    Static k-d tree of points for nearest neighbor distances, used by
+    HausdorffRef.
+
+    Attributes
+    ----------
+    points : list of tuple of float
+
+    Parameters
+    ----------
+    points : set of tuple of numbers
+    leaf_size : int
+        Number of points in a leaf, default is 8
+
+    Notes
+    -----
+    Points with a nan coordinate are left out of the tree, since their
+    distances never count in dxB.
+    """
+
+    def __init__(self, points, leaf_size=8):
+        self.points = point_tuples(points)
+        self.leaf_size = leaf_size
+        pts = [p for p in self.points if not any(v != v for v in p)]
+        self.root = self.build(pts, 0) if pts else None
+        super().__init__()
+
+    def build(self, pts, depth):
+        """Return the root of a subtree of points."""
+        if len(pts) <= self.leaf_size:
+            return KDNode(pts=pts)
+        axis = depth % len(pts[0])
+        pts = sorted(pts, key=lambda p: p[axis])
+        m = len(pts)//2
+        # points of 'lo' are not larger than 'split', of 'hi' not smaller
+        lo = self.build(pts[:m], depth + 1)
+        hi = self.build(pts[m:], depth + 1)
+        return KDNode(axis, pts[m][axis], lo, hi)
+
+    def nearest_sq(self, x, stop=float('-inf')):
+        """
+        Return the smallest squared distance from 'x' to the points, or
+        the first one found which is not larger than 'stop'.
+        """
+        best = float('inf')
+        stack = [(self.root, 0.0)] if self.root else []
+        while stack:
+            node, plane = stack.pop()
+            # the points of the node are at least 'plane' away
+            if plane > best:
+                continue
+            if node.pts is not None:
+                for p in node.pts:
+                    # summed in the order of edist
+                    d = sum([pow(a - b, 2) for a, b in zip(x, p)])
+                    if d < best:
+                        best = d
+                        if best <= stop:
+                            return best
+                continue
+            diff = x[node.axis] - node.split
+            if diff < 0:
+                stack.append((node.hi, pow(diff, 2)))
+                stack.append((node.lo, plane))
+            else:
+                stack.append((node.lo, pow(diff, 2)))
+                stack.append((node.hi, plane))
+        return best
+
+    def max_nearest_sq(self, A, dmax=float('-inf')):
+        """
+        Return the largest of 'dmax' and the smallest squared distances
+        from every point of 'A' to the points.
+        """
+        for a in A:
+            # a point no farther than 'dmax' cannot raise it
+            d = self.nearest_sq(a, dmax)
+            if d > dmax:
+                dmax = d
+        return dmax
@@ -25,7 +25,7 @@ pymoso
 
 Usage:
   pymoso listitems
-  pymoso solve [--budget=B] [--odir=D] [--crn] [--simpar=P]
+  pymoso solve [--budget=B] [--odir=D] [--crn] [--simpar=P] [--simexec=E]
     [(--seed <s> <s> <s> <s> <s> <s>)] [(--param <param> <val>)]...
     <problem> <solver> <x>...
   pymoso testsolve [--budget=B] [--odir=D] [--crn] [--isp=T] [--proc=Q]
@@ -39,6 +39,7 @@ Options:
   --odir=D                  Set the output file directory name. [default: testrun]
   --crn                     Set if common random numbers are desired.
   --simpar=P                Set number of parallel processes for simulation replications. [default: 1]
+  --simexec=E               Set the executor of parallel replications: serial, threads, or processes. [default: processes]
   --isp=T                   Set number of algorithm instances to solve. [default: 1]
   --proc=Q                  Set number of parallel processes for the algorithm instances. [default: 1]
   --metric                  Set if metric computation is desired.
@@ -53,6 +54,7 @@ Examples:
   pymoso solve --budget=100000 --odir=test1  ProbTPB RMINRLE 3 12
   pymoso solve --seed 12345 32123 5322 2 9543 666666666 ProbTPC RPERLE 31 21 11
   pymoso solve --simpar=4 --param betaeps 0.4 ProbTPA RPERLE 30 30
+  pymoso solve --simpar=4 --simexec=threads ProbTPA RPERLE 30 30
   pymoso solve --param radius 3 ProbTPA RPERLE 45 45
   pymoso testsolve --isp=16 --proc=4 TPATester RPERLE
   pymoso testsolve --isp=20 --proc=10 --metric --crn TPBTester RMINRLE 9 9
@@ -53,6 +53,7 @@ class Solve(BaseComm):
         name = self.options['--odir']
         hasseed = self.options['--seed']
         simpar = int(self.options['--simpar'])
+        simexec = self.options['--simexec']
         crn = self.options['--crn']
         if hasseed:
             seed = tuple(int(i) for i in self.options['<s>'])
@@ -130,6 +131,7 @@ class Solve(BaseComm):
         solve_kwargs['budget'] = budget
         solve_kwargs['seed'] = seed
         solve_kwargs['simpar'] = simpar
+        solve_kwargs['simexec'] = simexec
         solve_kwargs['crn'] = crn
         for i, p in enumerate(params):
             solve_kwargs[p] = float(vals[i])
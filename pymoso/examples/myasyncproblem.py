@@ -0,0 +1,61 @@
+# import the AsyncOracle base class
+import asyncio
+import os.path
+import sys
+from pymoso.chnbase import AsyncOracle
+
+simpath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mysimulator.py')
+
+class MyAsyncProblem(AsyncOracle):
+    '''Example of an oracle which sends replications to an external simulator.'''
+    def __init__(self, rng):
+        '''Specify the number of objectives and dimensionality of points.'''
+        self.num_obj = 2
+        self.dim = 1
+        # the simulator start-up, its pending requests, and the next request id
+        self.started = None
+        self.pending = dict()
+        self.nextid = 0
+        super().__init__(rng)
+
+    async def start(self):
+        '''Start the simulator and a task which reads its replies.'''
+        self.sim = await asyncio.create_subprocess_exec(sys.executable, simpath, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE)
+        self.reader = asyncio.ensure_future(self.read())
+
+    async def read(self):
+        '''Pass every reply to the replication awaiting it.'''
+        try:
+            async for line in self.sim.stdout:
+                vals = line.split()
+                fut = self.pending.pop(int(vals[0]))
+                fut.set_result((vals[1] == b'1', tuple(float(v) for v in vals[2:])))
+        finally:
+            # no more replies will come, so fail the replications still awaiting one
+            for fut in self.pending.values():
+                if not fut.done():
+                    fut.set_exception(RuntimeError('The simulator exited before replying.'))
+            self.pending.clear()
+
+    async def g(self, x, rng):
+        '''Send the point and the seed of rng to the simulator and await the objectives.'''
+        # start the simulator once, even if many replications begin at once
+        if self.started is None:
+            self.started = asyncio.ensure_future(self.start())
+        await self.started
+        if self.reader.done():
+            raise RuntimeError('The simulator exited.')
+        rid = self.nextid
+        self.nextid += 1
+        fut = asyncio.get_running_loop().create_future()
+        self.pending[rid] = fut
+        seed = rng.get_seed()
+        self.sim.stdin.write((' '.join(str(v) for v in (rid, ) + seed + x) + '\n').encode())
+        return await fut
+
+    async def close(self):
+        '''Stop the simulator.'''
+        if self.started is not None:
+            self.sim.stdin.close()
+            self.reader.cancel()
+            await self.sim.wait()
@@ -0,0 +1,31 @@
+# A stand-in for a long-lived external simulator, used by myasyncproblem.py.
+# It reads one request per line from stdin: an id, an mrg32k3a seed of 6
+# integers, and the point. After a delay, as if simulating, it writes the id,
+# 1 or 0 for feasibility, and the objective values on one line to stdout.
+# Requests are served concurrently, so replies may come out of order.
+import sys
+import threading
+from pymoso.prng.mrg32k3a import MRG32k3a
+
+# seconds each simulation takes
+delay = float(sys.argv[1]) if len(sys.argv) > 1 else 0.01
+lock = threading.Lock()
+
+def simulate(req):
+    '''Simulate the objectives of MyProblem using the seed of the request.'''
+    vals = req.split()
+    rid = vals[0]
+    rng = MRG32k3a(tuple(int(v) for v in vals[1:7]))
+    x = [int(v) for v in vals[7:]]
+    if all(-100 <= i <= 100 for i in x):
+        z0 = rng.normalvariate(0, 1)
+        z1 = rng.normalvariate(0, 1)
+        reply = '%s 1 %r %r\n' % (rid, x[0]**2 + z0, (x[0] - 2)**2 + z1)
+    else:
+        reply = '%s 0\n' % rid
+    with lock:
+        sys.stdout.write(reply)
+        sys.stdout.flush()
+
+for line in sys.stdin:
+    threading.Timer(delay, simulate, args=(line, )).start()
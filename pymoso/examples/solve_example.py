@@ -18,6 +18,9 @@ soln1 = solve(mp.MyProblem, rp.RPERLE, x0, budget=budget, seed=seed)
 # specify crn and simpar
 soln2 = solve(mp.MyProblem, rp.RPERLE, x0, crn=True, simpar=4)
 
+# use threads instead of processes for simpar
+soln2 = solve(mp.MyProblem, rp.RPERLE, x0, simpar=4, simexec='threads')
+
 # specify algorithm specific parameters
 soln3 = solve(mp.MyProblem, rp.RPERLE, x0, radius=2, betaeps=0.3, betadel=0.4)
 
@@ -1 +1 @@
-from .mrg32k3a import MRG32k3a, get_next_prnstream, jump_substream
+from .mrg32k3a import MRG32k3a, get_next_prnstream, jump_substream, mrg32k3a_block, get_prnstream, get_stream_seed, get_stream_seeds
@@ -29,14 +29,25 @@ with substream support.
 
 Listing
 -------
+SubstreamCache
 MRG323k3a
+mrg32k3a
+mrg32k3a_block
+bsm
+bsm_block
+expo_block
+jump_seed
 get_next_prnstream
 jump_substream
+get_stream_seed
+get_stream_seeds
+get_prnstream
 """
 
 import random
 from math import log
-import functools
+from array import array
+from collections import OrderedDict, namedtuple
 
 ## constants used in mrg32k3a and in substream generation
 ## all from:
@@ -75,6 +86,9 @@ mrga13n = 810728.0
 mrga21 = 527612.0
 mrga23n = 1370589.0
 
+# default maximum number of uniforms kept by a SubstreamCache, i.e. 32 MB
+crn_cache_size = 4194304
+
 
 #constants used for approximating the inverse standard normal cdf
 ## Beasly-Springer-Moro
@@ -116,6 +130,51 @@ def mrg32k3a(seed):
     return newseed, u
 
 
+def mrg32k3a_block(seed, n):
+    """
+    Generate a block of random numbers between 0 and 1 from a seed.
+
+    The block and the returned seed are identical to those produced by
+    'n' successive calls to 'mrg32k3a'. The recurrence is computed in
+    exact integer arithmetic, which agrees with the floating point
+    reduction in 'mrg32k3a' because every intermediate product is
+    smaller than 2^53.
+
+    Parameters
+    ----------
+    seed : tuple of int
+        Length must be 6.
+    n : int
+        Number of variates to generate
+
+    Returns
+    -------
+    newseed : tuple of int
+    u : array.array of float
+        Length is 'n'
+    """
+    m1 = int(mrgm1)
+    m2 = int(mrgm2)
+    a12 = int(mrga12)
+    a13n = int(mrga13n)
+    a21 = int(mrga21)
+    a23n = int(mrga23n)
+    norm = mrgnorm
+    s10, s11, s12, s20, s21, s22 = seed
+    u = array('d', bytes(8*n))
+    for i in range(n):
+        p1 = (a12*s11 - a13n*s10) % m1
+        p2 = (a21*s22 - a23n*s20) % m2
+        s10, s11, s12 = s11, s12, p1
+        s20, s21, s22 = s21, s22, p2
+        if p1 <= p2:
+            u[i] = (p1 - p2 + m1)*norm
+        else:
+            u[i] = (p1 - p2)*norm
+    newseed = (s10, s11, s12, s20, s21, s22)
+    return newseed, u
+
+
 # as in beasly-springer-moro
 def bsm(u):
     """
@@ -137,8 +196,9 @@ def bsm(u):
         r2 = pow(r, 2)
         r3 = pow(r, 3)
         r4 = pow(r, 4)
-        asum = sum([bsma[0], bsma[1]*r, bsma[2]*r2, bsma[3]*r3])
-        bsum = sum([1, bsmb[0]*r, bsmb[1]*r2, bsmb[2]*r3, bsmb[3]*r4])
+        # sum tuples rather than lists, in the same order
+        asum = sum((bsma[0], bsma[1]*r, bsma[2]*r2, bsma[3]*r3))
+        bsum = sum((1, bsmb[0]*r, bsmb[1]*r2, bsmb[2]*r3, bsmb[3]*r4))
         z = y*(asum/bsum)
     else:
         ## approximate from the tails (Moro 1995)
@@ -149,27 +209,212 @@ def bsm(u):
             signum = 1
             r = 1 - u
         s = log(-log(r))
-        s0 = pow(s, 2)
-        s1 = pow(s, 3)
-        s2 = pow(s, 4)
-        s3 = pow(s, 5)
-        s4 = pow(s, 6)
-        s5 = pow(s, 7)
-        s6 = pow(s, 8)
-        clst = [bsmc[0], bsmc[1]*s, bsmc[2]*s0, bsmc[3]*s1, bsmc[4]*s2, bsmc[5]*s3, bsmc[6]*s4, bsmc[7]*s5, bsmc[8]*s6]
-        t = sum(clst)
+        t = sum((bsmc[0], bsmc[1]*s, bsmc[2]*pow(s, 2), bsmc[3]*pow(s, 3),
+                 bsmc[4]*pow(s, 4), bsmc[5]*pow(s, 5), bsmc[6]*pow(s, 6),
+                 bsmc[7]*pow(s, 7), bsmc[8]*pow(s, 8)))
         z = signum*t
     return z
 
 
+def bsm_block(u, mu=0, sigma=1):
+    """
+    Approximate the quantiles of a normal distribution for a block of
+    quantiles.
+
+    Every element is sigma*bsm(u[i]) + mu. The elements are computed
+    one at a time in a Python loop, with the same pow and sum operations
+    in the same order as bsm, so the results are identical. It is only
+    faster than calling bsm on every element by the saved calls.
+
+    Parameters
+    ----------
+    u : sequence of float
+        Desired quantiles between 0 and 1
+    mu : float
+        Expected value of the normal distribution. Default is 0.
+    sigma : float
+        Standard deviation of the normal distribution. Default is 1.
+
+    Returns
+    -------
+    z : array.array of float
+    """
+    a0, a1, a2, a3 = bsma
+    b0, b1, b2, b3 = bsmb
+    c0, c1, c2, c3, c4, c5, c6, c7, c8 = bsmc
+    z = array('d', bytes(8*len(u)))
+    for i, ui in enumerate(u):
+        y = ui - 0.5
+        if abs(y) < 0.42:
+            r = pow(y, 2)
+            r2 = pow(r, 2)
+            r3 = pow(r, 3)
+            zi = y*(sum((a0, a1*r, a2*r2, a3*r3))/sum((1, b0*r, b1*r2, b2*r3, b3*pow(r, 4))))
+        else:
+            if y < 0.0:
+                signum = -1
+                r = ui
+            else:
+                signum = 1
+                r = 1 - ui
+            s = log(-log(r))
+            zi = signum*sum((c0, c1*s, c2*pow(s, 2), c3*pow(s, 3), c4*pow(s, 4),
+                             c5*pow(s, 5), c6*pow(s, 6), c7*pow(s, 7), c8*pow(s, 8)))
+        z[i] = sigma*zi + mu
+    return z
+
+
+def expo_block(u, lambd=1.0):
+    """
+    Compute exponential variates by inversion for a block of uniforms.
+
+    Every element is -log(1.0 - u[i])/lambd, as in
+    random.Random.expovariate.
+
+    Parameters
+    ----------
+    u : sequence of float
+        Uniform variates between 0 and 1
+    lambd : float
+        Rate of the exponential distribution. Default is 1.
+
+    Returns
+    -------
+    array.array of float
+    """
+    return array('d', [-log(1.0 - ui)/lambd for ui in u])
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+
+class SubstreamCache(object):
+    """
+    Least recently used cache of the uniforms drawn from substreams,
+    used to replay common random numbers.
+
+    Every entry is keyed by the seed at which a generator was seeded and
+    stores the uniforms drawn since in a compact array, along with the
+    seed following the last of them. When the total number of stored
+    uniforms exceeds 'maxsize', the least recently used entries are
+    evicted. The size is checked when a generator switches substreams.
+    Uniforms which a generator adds to an entry after it was evicted are
+    not counted.
+
+    Attributes
+    ----------
+    maxsize : int
+        Maximum number of uniforms to store
+    currsize : int
+        Number of stored uniforms
+    hits : int
+        Number of times a seeded substream was found in the cache
+    misses : int
+        Number of times a seeded substream was not in the cache
+    evictions : int
+        Number of entries evicted
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Default is crn_cache_size
+    """
+
+    def __init__(self, maxsize=crn_cache_size):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.currsize = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        super().__init__()
+
+    def get_entry(self, seed):
+        """
+        Return the entry of a substream, creating it if needed.
+
+        Parameters
+        ----------
+        seed : tuple of int
+
+        Returns
+        -------
+        entry : list
+            entry[0] is an array.array of the stored uniforms, entry[1]
+            is the seed following them, entry[2] is the number of them
+            counted in 'currsize'
+        """
+        entries = self.entries
+        entry = entries.get(seed)
+        if entry is None:
+            self.misses += 1
+            entry = [array('d'), seed, 0]
+            entries[seed] = entry
+        else:
+            self.hits += 1
+            entries.move_to_end(seed)
+        return entry
+
+    def grow(self, seed, entry, num):
+        """
+        Account for new stored uniforms and evict entries as needed.
+
+        Parameters
+        ----------
+        seed : tuple of int
+            Key of the entry
+        entry : list
+            Entry returned by 'get_entry'
+        num : int
+            Number of uniforms added to the entry
+        """
+        entries = self.entries
+        # the entry may have been evicted since
+        if entries.get(seed) is entry:
+            entry[2] += num
+            self.currsize += num
+        # keep the most recently used entry
+        while self.currsize > self.maxsize and len(entries) > 1:
+            _, old = entries.popitem(last=False)
+            self.currsize -= old[2]
+            self.evictions += 1
+
+    def cache_info(self):
+        """
+        Report the cache statistics.
+
+        Returns
+        -------
+        CacheInfo
+            Named tuple of hits, misses, evictions, maxsize, and currsize
+        """
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, self.currsize)
+
+    def cache_clear(self):
+        """
+        Remove every entry. The hit, miss, and eviction counts are kept.
+        """
+        self.entries.clear()
+        self.currsize = 0
+
+
 class MRG32k3a(random.Random):
     """
     Implements mrg32k3a as the generator for a random.Random object
 
+    The state of the generator is only the 6 integer mrg32k3a seed. The
+    Mersenne Twister state of random.Random is never seeded nor saved,
+    so drawing, seeding, and saving or restoring the state are
+    constant time operations. The random.Random helpers which are built
+    on 'random', e.g. 'expovariate' and 'choice', use mrg32k3a.
+
     Attributes
     ----------
     _current_seed : tuple of int
         6 integer mrg32k3a seed
+    cache : SubstreamCache object or None
+        Cache from which to replay the uniforms of previously seeded
+        substreams, e.g. for common random numbers
 
     Parameters
     ----------
@@ -188,27 +433,45 @@ class MRG32k3a(random.Random):
         self.version = 2
         self.generate = mrg32k3a
         self.bsm = bsm
+        self.cache = None
         super().__init__(x)
 
-    def set_class_cache(self, cache_flag):
+    def set_class_cache(self, cache_flag, maxsize=crn_cache_size):
         """
-        Sets whether to use an LRU cache for both the random function and the
-        bsm function.
+        Sets whether to replay the uniforms of previously seeded
+        substreams from a bounded cache.
 
         Parameters
         ----------
         cache_flag : bool
+        maxsize : int, optional
+            Maximum number of uniforms to store. Default is
+            crn_cache_size.
 
         See also
         --------
-        functools.lru_cache
+        SubstreamCache
         """
         if not cache_flag:
-            self.generate = mrg32k3a
-            self.bsm = bsm
+            self.set_cache(None)
         else:
-            self.generate = functools.lru_cache(maxsize=None)(mrg32k3a)
-            self.bsm = functools.lru_cache(maxsize=None)(bsm)
+            self.set_cache(SubstreamCache(maxsize))
+
+    def set_cache(self, cache):
+        """
+        Use a cache, possibly shared with other generators, from which to
+        replay substreams.
+
+        Parameters
+        ----------
+        cache : SubstreamCache object or None
+        """
+        seed = self.get_seed()
+        if self.cache is not None and self._cache_grown:
+            self.cache.grow(self._current_seed, self._cache_entry, self._cache_grown)
+        self.cache = cache
+        self._cache_grown = 0
+        self.seed(seed)
 
     def seed(self, a):
         """
@@ -219,8 +482,16 @@ class MRG32k3a(random.Random):
         a : tuple of int
         """
         assert(len(a) == 6)
+        cache = self.cache
+        # account for the uniforms added to the previous substream
+        if cache is not None and self._cache_grown:
+            cache.grow(self._current_seed, self._cache_entry, self._cache_grown)
         self._current_seed = a
-        super().seed(a)
+        self.gauss_next = None
+        if cache is not None:
+            self._cache_entry = cache.get_entry(a)
+            self._cache_pos = 0
+            self._cache_grown = 0
 
     def random(self):
         """
@@ -231,9 +502,59 @@ class MRG32k3a(random.Random):
         -------
         u : float
         """
-        seed = self._current_seed
-        newseed, u = self.generate(seed)
-        self.seed(newseed)
+        if self.cache is not None:
+            return self.replay()
+        newseed, u = self.generate(self._current_seed)
+        self._current_seed = newseed
+        return u
+
+    def replay(self):
+        """
+        Generate a standard uniform variate from the cached substream,
+        extending it if needed, and advance the generator state.
+
+        Returns
+        -------
+        u : float
+        """
+        entry = self._cache_entry
+        ulst = entry[0]
+        pos = self._cache_pos
+        self._cache_pos = pos + 1
+        if pos < len(ulst):
+            return ulst[pos]
+        newseed, u = self.generate(entry[1])
+        entry[1] = newseed
+        ulst.append(u)
+        self._cache_grown += 1
+        return u
+
+    def random_block(self, n):
+        """
+        Generate 'n' standard uniform variates and advance the generator
+        state past them.
+
+        The variates and the resulting state are the same as those of 'n'
+        calls to 'random'.
+
+        Parameters
+        ----------
+        n : int
+            Number of variates to generate
+
+        Returns
+        -------
+        u : array.array of float
+            Length is 'n'
+
+        See also
+        --------
+        mrg32k3a_block
+        """
+        if self.cache is not None:
+            return array('d', [self.replay() for i in range(n)])
+        newseed, u = mrg32k3a_block(self._current_seed, n)
+        self._current_seed = newseed
         return u
 
     def get_seed(self):
@@ -245,6 +566,14 @@ class MRG32k3a(random.Random):
         tuple of int
             The current mrg32k3a seed
         """
+        if self.cache is not None and self._cache_pos:
+            # the seed is not tracked while replaying a cached substream
+            entry = self._cache_entry
+            pos = self._cache_pos
+            if pos == len(entry[0]):
+                return entry[1]
+            seed, _ = mrg32k3a_block(self._current_seed, pos)
+            return seed
         return self._current_seed
 
     def getstate(self):
@@ -255,14 +584,12 @@ class MRG32k3a(random.Random):
         -------
         tuple of int
             The current seed
-        tuple
-            Random.getstate output
 
         See also
         --------
         random.Random
         """
-        return self.get_seed(), super().getstate()
+        return self.get_seed()
 
     def setstate(self, state):
         """
@@ -271,14 +598,16 @@ class MRG32k3a(random.Random):
         Parameters
         ----------
         state : tuple
-            tuple[0] is mrg32k3a seed, [1] is random.Random.getstate
+            The mrg32k3a seed. For compatibility, a tuple of length 2
+            whose first item is the seed is also accepted.
 
         See also
         --------
         random.Random
         """
-        self.seed(state[0])
-        super().setstate(state[1])
+        if len(state) == 2:
+            state = state[0]
+        self.seed(state)
 
     def normalvariate(self, mu=0, sigma=1):
         """
@@ -303,6 +632,52 @@ class MRG32k3a(random.Random):
         z = self.bsm(u)
         return sigma*z + mu
 
+    def normal_block(self, n, mu=0, sigma=1):
+        """
+        Generate a block of normal random variates.
+
+        The variates and the resulting generator state are the same as
+        those of 'n' calls to 'normalvariate'.
+
+        Parameters
+        ----------
+        n : int
+            Number of variates to generate
+        mu : float
+            Expected value of the normal distribution from which to
+            generate. Default is 0.
+        sigma : float
+            Standard deviation of the normal distribution from which to
+            generate. Default is 1.
+
+        Returns
+        -------
+        array.array of float
+            Length is 'n'
+        """
+        return bsm_block(self.random_block(n), mu, sigma)
+
+    def expo_block(self, n, lambd=1.0):
+        """
+        Generate a block of exponential random variates.
+
+        The variates and the resulting generator state are the same as
+        those of 'n' calls to 'expovariate'.
+
+        Parameters
+        ----------
+        n : int
+            Number of variates to generate
+        lambd : float
+            Rate of the exponential distribution. Default is 1.
+
+        Returns
+        -------
+        array.array of float
+            Length is 'n'
+        """
+        return expo_block(self.random_block(n), lambd)
+
 
 def mat333mult(a, b):
     """
@@ -350,6 +725,43 @@ def mat311mod(a, b):
     return res
 
 
+def jump_seed(seed, a1, a2):
+    """
+    Compute the seed reached by multiplying each half of a seed by
+    a jump matrix.
+
+    The arithmetic is that of 'mat333mult' followed by 'mat311mod' and
+    produces the same seeds, without building the intermediate lists.
+
+    Parameters
+    ----------
+    seed : tuple of int
+        Length must be 6.
+    a1 : list of list of float
+        3x3 jump matrix of the first component, e.g. a1p127
+    a2 : list of list of float
+        3x3 jump matrix of the second component, e.g. a2p127
+
+    Returns
+    -------
+    tuple of int
+    """
+    s0, s1, s2, s3, s4, s5 = seed
+    m1 = mrgm1
+    m2 = mrgm2
+    r0, r1, r2 = a1
+    n0 = sum((r0[0]*s0, r0[1]*s1, r0[2]*s2))
+    n1 = sum((r1[0]*s0, r1[1]*s1, r1[2]*s2))
+    n2 = sum((r2[0]*s0, r2[1]*s1, r2[2]*s2))
+    r3, r4, r5 = a2
+    n3 = sum((r3[0]*s3, r3[1]*s4, r3[2]*s5))
+    n4 = sum((r4[0]*s3, r4[1]*s4, r4[2]*s5))
+    n5 = sum((r5[0]*s3, r5[1]*s4, r5[2]*s5))
+    return (int(n0 - int(n0/m1)*m1), int(n1 - int(n1/m1)*m1),
+            int(n2 - int(n2/m1)*m1), int(n3 - int(n3/m2)*m2),
+            int(n4 - int(n4/m2)*m2), int(n5 - int(n5/m2)*m2))
+
+
 def get_next_prnstream(seed, use_cache):
     """
     Instantiate a generator seeded 2^127 steps from the input seed.
@@ -364,20 +776,12 @@ def get_next_prnstream(seed, use_cache):
     prn : MRG32k3a object
     """
     assert(len(seed) == 6)
-    # split the seed into 2 components of length 3
-    s1 = seed[0:3]
-    s2 = seed[3:6]
     # A*s % m for both seed parts
-    ns1m = mat333mult(a1p127, s1)
-    ns2m = mat333mult(a2p127, s2)
-    ns1 = mat311mod(ns1m, mrgm1)
-    ns2 = mat311mod(ns2m, mrgm2)
-    # random.Random objects need a hashable seed e.g. a tuple
-    sseed = tuple(ns1 + ns2)
-    prn = MRG32k3a(sseed)
+    prn = MRG32k3a(jump_seed(seed, a1p127, a2p127))
     prn.set_class_cache(use_cache)
     return prn
 
+
 def jump_substream(prn):
     """
     Advance the rng to the next substream 2^76 steps.
@@ -386,15 +790,193 @@ def jump_substream(prn):
     ----------
     prn : MRG32k3a object
     """
-    seed = prn.get_seed()
-    # split the seed into 2 components of length 3
-    s1 = seed[0:3]
-    s2 = seed[3:6]
     # A*s % m for both seed parts
-    ns1m = mat333mult(a1p76, s1)
-    ns2m = mat333mult(a2p76, s2)
-    ns1 = mat311mod(ns1m, mrgm1)
-    ns2 = mat311mod(ns2m, mrgm2)
-    # random.Random objects need a hashable seed e.g. a tuple
-    sseed = tuple(ns1 + ns2)
-    prn.seed(sseed)
+    prn.seed(jump_seed(prn.get_seed(), a1p76, a2p76))
+
+
+def mat33mod(a, b, m):
+    """
+    Multiply two 3x3 matrices modulo m in exact integer arithmetic.
+
+    Parameters
+    ----------
+    a : tuple of tuple of int
+        3x3 matrix
+    b : tuple of tuple of int
+        3x3 matrix
+    m : int
+        modulus
+
+    Returns
+    -------
+    tuple of tuple of int
+        3x3 matrix
+    """
+    r3 = range(3)
+    return tuple(tuple(sum(a[i][k]*b[k][j] for k in r3) % m for j in r3) for i in r3)
+
+
+def mat33pows(a, m, num_pows):
+    """
+    Compute the repeated squares of a 3x3 matrix modulo m.
+
+    Parameters
+    ----------
+    a : list of list of float
+        3x3 matrix with integer entries
+    m : int
+        modulus
+    num_pows : int
+        Number of squares to compute
+
+    Returns
+    -------
+    pows : list of tuple of tuple of int
+        pows[i] is a^(2^i) mod m
+    """
+    pows = [tuple(tuple(int(aij) for aij in ai) for ai in a)]
+    for i in range(1, num_pows):
+        pows.append(mat33mod(pows[i - 1], pows[i - 1], m))
+    return pows
+
+
+# repeated squares of the stream and substream jump matrices, allowing
+# 2^64 streams of 2^51 substreams
+a1p127pows = mat33pows(a1p127, int(mrgm1), 64)
+a2p127pows = mat33pows(a2p127, int(mrgm2), 64)
+a1p76pows = mat33pows(a1p76, int(mrgm1), 51)
+a2p76pows = mat33pows(a2p76, int(mrgm2), 51)
+
+
+def mat33powmod(pows, k, m):
+    """
+    Compute a^k mod m from the repeated squares of a.
+
+    Parameters
+    ----------
+    pows : list of tuple of tuple of int
+        Output of 'mat33pows'
+    k : int
+        Non-negative exponent smaller than 2^len('pows')
+    m : int
+        modulus
+
+    Returns
+    -------
+    res : tuple of tuple of int
+        3x3 matrix
+    """
+    assert(k < 1 << len(pows))
+    res = ((1, 0, 0), (0, 1, 0), (0, 0, 1))
+    i = 0
+    while k:
+        if k & 1:
+            res = mat33mod(pows[i], res, m)
+        k >>= 1
+        i += 1
+    return res
+
+
+def get_stream_seed(seed, stream, substream=0):
+    """
+    Compute the seed of a stream and substream relative to a seed.
+
+    The seed is exactly 'stream'*2^127 + 'substream'*2^76 steps from
+    'seed' and is computed with O(log(stream) + log(substream)) matrix
+    products.
+
+    Parameters
+    ----------
+    seed : tuple of int
+        Length must be 6.
+    stream : int
+        Non-negative index of the stream, smaller than 2^64
+    substream : int
+        Non-negative index of the substream, smaller than 2^51. Default
+        is 0.
+
+    Returns
+    -------
+    tuple of int
+        The mrg32k3a seed
+    """
+    assert(len(seed) == 6)
+    m1 = int(mrgm1)
+    m2 = int(mrgm2)
+    a1 = mat33mod(mat33powmod(a1p76pows, substream, m1), mat33powmod(a1p127pows, stream, m1), m1)
+    a2 = mat33mod(mat33powmod(a2p76pows, substream, m2), mat33powmod(a2p127pows, stream, m2), m2)
+    r3 = range(3)
+    s1 = tuple(sum(a1[i][j]*seed[j] for j in r3) % m1 for i in r3)
+    s2 = tuple(sum(a2[i][j]*seed[j + 3] for j in r3) % m2 for i in r3)
+    return s1 + s2
+
+
+def get_stream_seeds(seed, first, num, step=1):
+    """
+    Compute the seeds of equally spaced streams relative to a seed.
+
+    Parameters
+    ----------
+    seed : tuple of int
+        Length must be 6.
+    first : int
+        Non-negative index of the first stream
+    num : int
+        Number of seeds to compute
+    step : int
+        Positive spacing of the stream indices, default is 1
+
+    Returns
+    -------
+    seeds : list of tuple of int
+        seeds[i] is the seed of stream 'first' + i*'step'
+
+    See also
+    --------
+    get_stream_seed
+    """
+    m1 = int(mrgm1)
+    m2 = int(mrgm2)
+    (b0, b1, b2) = mat33powmod(a1p127pows, step, m1)
+    (b3, b4, b5) = mat33powmod(a2p127pows, step, m2)
+    seeds = []
+    if num > 0:
+        s0, s1, s2, s3, s4, s5 = get_stream_seed(seed, first)
+        seeds.append((s0, s1, s2, s3, s4, s5))
+    for i in range(1, num):
+        s0, s1, s2, s3, s4, s5 = (
+            (b0[0]*s0 + b0[1]*s1 + b0[2]*s2) % m1,
+            (b1[0]*s0 + b1[1]*s1 + b1[2]*s2) % m1,
+            (b2[0]*s0 + b2[1]*s1 + b2[2]*s2) % m1,
+            (b3[0]*s3 + b3[1]*s4 + b3[2]*s5) % m2,
+            (b4[0]*s3 + b4[1]*s4 + b4[2]*s5) % m2,
+            (b5[0]*s3 + b5[1]*s4 + b5[2]*s5) % m2)
+        seeds.append((s0, s1, s2, s3, s4, s5))
+    return seeds
+
+
+def get_prnstream(seed, stream, substream=0, use_cache=False):
+    """
+    Instantiate a generator seeded at a stream and substream of a seed.
+
+    Parameters
+    ----------
+    seed : tuple of int
+    stream : int
+        Non-negative index of the stream
+    substream : int
+        Non-negative index of the substream, default is 0
+    use_cache : bool
+        Default is False
+
+    Returns
+    -------
+    prn : MRG32k3a object
+
+    See also
+    --------
+    get_stream_seed
+    """
+    prn = MRG32k3a(get_stream_seed(seed, stream, substream))
+    prn.set_class_cache(use_cache)
+    return prn
@@ -26,6 +26,7 @@ Summary
 Provides implementation of the Bus Scheduling problem for use in PyMOSO.
 """
 from ..chnbase import Oracle
+from ..prng.mrg32k3a import mrg32k3a_block, expo_block
 
 class BSProb(Oracle):
     """
@@ -72,6 +73,56 @@ class BSProb(Oracle):
         x : tuple of int
         rng : prng.MRG32k3a object
 
+        Returns
+        -------
+        isfeas : bool
+        tuple of float
+            simulated objective values
+        """
+        arrlambda = self.lambd
+        return self.simulate(x, lambda: rng.expovariate(arrlambda))
+
+    def g_batch(self, x, m, streams):
+        """
+        Simulates 'm' replications, each from its own substream. The
+        passenger interarrival times are generated in blocks.
+
+        Parameters
+        ----------
+        x : tuple of int
+        m : int
+        streams : list of tuple of int
+            mrg32k3a seeds of the replications
+
+        Returns
+        -------
+        list of tuple
+            pairs of isfeas and the simulated objective values
+
+        See also
+        --------
+        g
+        """
+        arrlambda = self.lambd
+        # about the expected number of arrivals in a day
+        blocksize = int(arrlambda*self.tau) + 1
+        def interarrivals(seed):
+            while True:
+                seed, u = mrg32k3a_block(seed, blocksize)
+                yield from expo_block(u, arrlambda)
+        return [self.simulate(x, interarrivals(seed).__next__) for seed in streams]
+
+    def simulate(self, x, interarrival):
+        """
+        Simulates one replication of the Bus Scheduling problem from a
+        sequence of passenger interarrival times.
+
+        Parameters
+        ----------
+        x : tuple of int
+        interarrival : function
+            Returns the next interarrival time when called
+
         Returns
         -------
         isfeas : bool
@@ -106,7 +157,7 @@ class BSProb(Oracle):
                 bustime = tau
             tarrive = 0
             # simulate first arrival time now
-            tarrive += rng.expovariate(arrlambda)
+            tarrive += interarrival()
             currbus = 0
             waitsum = 0
             numlastbus = 0
@@ -131,7 +182,7 @@ class BSProb(Oracle):
                     numlastbus += 1
                     bus_not_found = True
                 waitsum += (bustime - tarrive)
-                tarrive += rng.expovariate(arrlambda)
+                tarrive += interarrival()
 ##            if not sum(numperbus) + numlastbus == numarrive:
 ##                print('-- -- number of arrivals does not match number of bus boarders. wtf?')
 ##          print(x, newx, waitsum, numperbus, num_buses)
@@ -28,6 +28,7 @@ Provides implementation of the Test Simple SO Problem
 Oracle for use in PyMOSO.
 """
 from ..chnbase import Oracle
+from ..prng.mrg32k3a import mrg32k3a_block, bsm_block
 
 
 class ProbSimpleSO(Oracle):
@@ -62,6 +63,51 @@ class ProbSimpleSO(Oracle):
         x : tuple of int
         rng : prng.MRG32k3a object
 
+        Returns
+        -------
+        isfeas : bool
+        tuple of float
+            simulated objective values
+        """
+        return self.simulate(x, lambda: rng.normalvariate(0, 3))
+
+    def g_batch(self, x, m, streams):
+        """
+        Simulates 'm' replications, each from its own substream. The
+        normal variates of a replication are generated in one block.
+
+        Parameters
+        ----------
+        x : tuple of int
+        m : int
+        streams : list of tuple of int
+            mrg32k3a seeds of the replications
+
+        Returns
+        -------
+        list of tuple
+            pairs of isfeas and the simulated objective values
+
+        See also
+        --------
+        g
+        """
+        def normals(seed):
+            _, u = mrg32k3a_block(seed, 1)
+            yield from bsm_block(u, 0, 3)
+        return [self.simulate(x, normals(seed).__next__) for seed in streams]
+
+    def simulate(self, x, normal):
+        """
+        Simulates one replication from a sequence of normal variates.
+
+        Parameters
+        ----------
+        x : tuple of int
+        normal : function
+            Returns the next normal variate with mean 0 and standard
+            deviation 3 when called
+
         Returns
         -------
         isfeas : bool
@@ -75,6 +121,6 @@ class ProbSimpleSO(Oracle):
                 isfeas = False
         obj1 = []
         if isfeas:
-            z1 = rng.normalvariate(0, 3)
+            z1 = normal()
             obj1 = x[0]**2 + z1
         return isfeas, (obj1, )
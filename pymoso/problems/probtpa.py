@@ -27,6 +27,7 @@ Summary
 Provides implementation of the Test Problem A Oracle for use in PyMOSO.
 """
 from ..chnbase import Oracle
+from ..prng.mrg32k3a import mrg32k3a_block, bsm_block
 
 
 class ProbTPA(Oracle):
@@ -61,6 +62,50 @@ class ProbTPA(Oracle):
         x : tuple of int
         rng : prng.MRG32k3a object
 
+        Returns
+        -------
+        isfeas : bool
+        tuple of float
+            simulated objective values
+        """
+        return self.simulate(x, lambda: rng.normalvariate(0, 1))
+
+    def g_batch(self, x, m, streams):
+        """
+        Simulates 'm' replications, each from its own substream. The
+        normal variates of a replication are generated in one block.
+
+        Parameters
+        ----------
+        x : tuple of int
+        m : int
+        streams : list of tuple of int
+            mrg32k3a seeds of the replications
+
+        Returns
+        -------
+        list of tuple
+            pairs of isfeas and the simulated objective values
+
+        See also
+        --------
+        g
+        """
+        def normals(seed):
+            _, u = mrg32k3a_block(seed, 3)
+            yield from bsm_block(u, 0, 1)
+        return [self.simulate(x, normals(seed).__next__) for seed in streams]
+
+    def simulate(self, x, normal):
+        """
+        Simulates one replication from a sequence of normal variates.
+
+        Parameters
+        ----------
+        x : tuple of int
+        normal : function
+            Returns the next standard normal variate when called
+
         Returns
         -------
         isfeas : bool
@@ -75,9 +120,9 @@ class ProbTPA(Oracle):
         obj1 = None
         obj2 = None
         if isfeas:
-            z1 = rng.normalvariate(0, 1)
-            z2 = rng.normalvariate(0, 1)
-            z3 = rng.normalvariate(0, 1)
+            z1 = normal()
+            z2 = normal()
+            z3 = normal()
             xi = [z1**2, z2**2, z3**2]
             obj1 = (x[0]/10.0 - 2.0*xi[0])**2 + (x[1]/10.0 - xi[1])**2
             obj2 = (x[0]**2)/100.0 + (x[1]/10.0 - 2.0*xi[2])**2
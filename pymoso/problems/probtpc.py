@@ -27,6 +27,7 @@ Summary
 Provides implementation of the Test Problem C Oracle for use in PyMOSO.
 """
 from ..chnbase import Oracle
+from ..prng.mrg32k3a import mrg32k3a_block, bsm_block
 from math import exp, sqrt, sin
 
 
@@ -65,6 +66,50 @@ class ProbTPC(Oracle):
         x : tuple of int
         rng : prng.MRG32k3a object
 
+        Returns
+        -------
+        isfeas : bool
+        tuple of float
+            simulated objective values
+        """
+        return self.simulate(x, lambda: rng.normalvariate(0, 1))
+
+    def g_batch(self, x, m, streams):
+        """
+        Simulates 'm' replications, each from its own substream. The
+        normal variates of a replication are generated in one block.
+
+        Parameters
+        ----------
+        x : tuple of int
+        m : int
+        streams : list of tuple of int
+            mrg32k3a seeds of the replications
+
+        Returns
+        -------
+        list of tuple
+            pairs of isfeas and the simulated objective values
+
+        See also
+        --------
+        g
+        """
+        def normals(seed):
+            _, u = mrg32k3a_block(seed, 3)
+            yield from bsm_block(u, 0, 1)
+        return [self.simulate(x, normals(seed).__next__) for seed in streams]
+
+    def simulate(self, x, normal):
+        """
+        Simulates one replication from a sequence of normal variates.
+
+        Parameters
+        ----------
+        x : tuple of int
+        normal : function
+            Returns the next standard normal variate when called
+
         Returns
         -------
         isfeas : bool
@@ -80,9 +125,9 @@ class ProbTPC(Oracle):
             if not xi in xr:
                 isfeas = False
         if isfeas:
-            z1 = rng.normalvariate(0, 1)
-            z2 = rng.normalvariate(0, 1)
-            z3 = rng.normalvariate(0, 1)
+            z1 = normal()
+            z2 = normal()
+            z3 = normal()
             xi = (z1**2, z2**2, z3**2)
             x = tuple(i/df for i in x)
             s = [sin(i) for i in x]
@@ -136,37 +136,15 @@ class RPERLE(RLESolver):
         L = Lk[k_opt]
         eps = sorted(epslst[k_opt])
         c = len(eps)
-        mcAeps = set()
-        if c > 0:
-            for ep in eps:
-                lmax = float('-inf')
-                hi_blist = [mcJ[i][HI] for i in range(c0 - 1) if mcJ[i][HI] < ep]
-                if hi_blist:
-                    lmax = max(hi_blist)
-                #print('minlst: ', hi_blist)
-                epL = max(lmax, L)
-                epnew = ep
-                mcA = set()
-                mcT = set()
-                while epL < epnew:
-                    # print('epL: ', epL)
-                    # print('epnew: ', epnew)
-                    #print('a1new: ', {x: self.gbar[x][k_con] for x in a1new})
-                    stpts = {x: self.gbar[x] for x in a1new | mcT if self.gbar[x][k_con] <= epnew}
-                    #print('starts: ', stpts)
-                    tbx0 = min(stpts, key=lambda t: self.gbar[t][k_opt])
-                    fxtb0 = self.gbar[tbx0]
-                    #print('found: ', tbx0, fxtb0[k_con])
-                    setbx0 = self.sehat[tbx0]
-                    mcTp, xst, fxst, sexst = self.spline(tbx0, epnew, k_opt, k_con)
-                    mcA |= {xst}
-                    mcT |= mcTp
-                    back_dist = self.fse(sexst[k_con])
-                    if back_dist == 0.0:
-                        back_dist = 0.000001
-                    #print(epnew, ' > ', fxst[k_con], ' and ', fxtb0[k_con], ' < ', epnew)
-                    epnew = fxst[k_con] - back_dist
-                mcAeps |= mcA
+        windows = []
+        for ep in eps:
+            lmax = float('-inf')
+            hi_blist = [mcJ[i][HI] for i in range(c0 - 1) if mcJ[i][HI] < ep]
+            if hi_blist:
+                lmax = max(hi_blist)
+            #print('minlst: ', hi_blist)
+            windows.append((max(lmax, L), ep))
+        mcAeps = self.eps_windows(a1new, windows, k_opt, k_con)
         tmp = {x: self.gbar[x] for x in mcAeps | a1new}
         phatp = get_biparetos(tmp)
         return phatp
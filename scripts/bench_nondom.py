@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""
+Time the non-dominated filters of chnutils on seeded random values.
+
+Run from the repository root:
+
+    python scripts/bench_nondom.py [max_seconds]
+
+For 3 and 4 objectives and 10^3, 10^4, and 10^5 values, the script
+times 'front', 'kung_front', and with numpy 'block_front' and
+'get_nondom'. Values are drawn either uniformly from the unit cube,
+which gives few non-dominated values, or near the unit simplex, which
+makes nearly all of them non-dominated. Once a filter takes more than
+max_seconds (default 10) on a case, it is skipped for the larger sizes
+of that case. The seed is fixed, so the same values are timed on every
+run.
+
+Listing
+--------------
+get_values, function
+time_filter, function
+main, function
+"""
+import os
+import random
+import sys
+from time import perf_counter
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pymoso.chnutils import front, kung_front, get_nondom, np
+if np is not None:
+    from pymoso.chnutils import block_front
+
+
+seed = 12345
+sizes = [1000, 10000, 100000]
+dims = [3, 4]
+kinds = ['uniform', 'simplex']
+
+
+def get_values(n, d, kind, rng):
+    """
+    Generate random objective values in increasing lexicographic order.
+
+    Parameters
+    ----------
+    n : int
+        Number of values
+    d : int
+        Number of objectives
+    kind : str
+        'uniform' for the unit cube, 'simplex' for near the unit simplex
+    rng : random.Random
+
+    Returns
+    -------
+    list of tuple of float
+    """
+    vals = []
+    for i in range(n):
+        if kind == 'uniform':
+            vals.append(tuple(rng.random() for k in range(d)))
+        else:
+            v = [rng.expovariate(1) for k in range(d)]
+            vsum = sum(v)
+            vals.append(tuple(vk/vsum + 0.01*rng.random() for vk in v))
+    return sorted(vals)
+
+
+def time_filter(name, vals):
+    """
+    Time one filter on sorted values.
+
+    Parameters
+    ----------
+    name : str
+        One of 'front', 'kung', 'block', or 'get_nondom'
+    vals : list of tuple of float
+
+    Returns
+    -------
+    float
+        Wall time in seconds
+    int
+        Number of non-dominated values found
+    """
+    t0 = perf_counter()
+    if name == 'front':
+        nondom = front(list(range(len(vals))), vals)[0]
+    elif name == 'kung':
+        nondom = kung_front(vals)
+    elif name == 'block':
+        nondom = block_front(vals)
+    else:
+        nondom = get_nondom({i: g for i, g in enumerate(vals)})
+    return perf_counter() - t0, len(nondom)
+
+
+def main():
+    max_seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    names = ['front', 'kung']
+    if np is not None:
+        names += ['block', 'get_nondom']
+    print('%4s %8s %7s %9s  %s' % ('d', 'values', 'n', 'nondom', '  '.join('%10s' % name for name in names)))
+    for d in dims:
+        for kind in kinds:
+            slow = set()
+            for n in sizes:
+                vals = get_values(n, d, kind, random.Random(seed))
+                times = []
+                nondom = None
+                for name in names:
+                    if name in slow:
+                        times.append('%10s' % '-')
+                        continue
+                    t, num = time_filter(name, vals)
+                    nondom = num
+                    times.append('%10.3f' % t)
+                    if t > max_seconds:
+                        slow.add(name)
+                print('%4d %8s %7d %9d  %s' % (d, kind, n, nondom, '  '.join(times)), flush=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+"""
+Check that the optimizations which promise results identical to the
+plain implementations keep them.
+
+Run from the repository root:
+
+    python scripts/check_equivalence.py
+
+Every check prints its name and 'ok', or its first mismatch. The script
+exits with status 1 if any check fails.
+
+Listing
+--------------
+check_parallel_solve, function
+check_objpar, function
+check_epspar, function
+check_stream_seeds, function
+check_crn_cache, function
+check_dominance, function
+check_nondom, function
+"""
+import os
+import random
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pymoso.chnutils import solve, get_testsolve_prnstreams, does_weak_dominate, does_dominate, does_strict_dominate, dominance_mask, dominance_matrix, get_nondom, sweep_front, front, kung_front, argsort, np
+if np is not None:
+    from pymoso.chnutils import block_front
+from pymoso.prng.mrg32k3a import MRG32k3a, SubstreamCache, get_stream_seed, get_stream_seeds, a1p127, a2p127, a1p76, a2p76, mrgm1, mrgm2
+from pymoso.problems.probtpa import ProbTPA
+from pymoso.problems.probtpb import ProbTPB
+from pymoso.problems.probtpc import ProbTPC
+from pymoso.problems.probsimpleso import ProbSimpleSO
+from pymoso.solvers.rperle import RPERLE
+from pymoso.solvers.rminrle import RMINRLE
+from pymoso.solvers.rpe import RPE
+from pymoso.solvers.rspline import RSPLINE
+
+
+seed = (12345, 12345, 12345, 12345, 12345, 12345)
+solve_cases = [
+    (ProbTPA, RPERLE, (4, 14), 1000),
+    (ProbTPB, RPE, (3, 12), 1000),
+    (ProbTPC, RMINRLE, (3, 2, 1), 1000),
+    (ProbSimpleSO, RSPLINE, (37, ), 1000),
+]
+
+
+def check_parallel_solve():
+    """
+    Solve every case serially and with 2 processes and 2 threads, with
+    and without crn, and compare the solutions and end seeds.
+
+    Returns
+    -------
+    str or None
+        The first mismatch
+    """
+    for problem, solver, x0, budget in solve_cases:
+        for crn in (False, True):
+            kwargs = dict(budget=budget, seed=seed, crn=crn)
+            res = solve(problem, solver, x0, simpar=1, **kwargs)
+            for simexec in ('processes', 'threads'):
+                pres = solve(problem, solver, x0, simpar=2, simexec=simexec, **kwargs)
+                if not pres == res:
+                    return '%s %s crn=%s with %s' % (problem.__name__, solver.__name__, crn, simexec)
+    return None
+
+
+def check_objpar():
+    """
+    Solve every case with several objectives with objpar 0 and 1, and
+    with objpar 2 and 3, with and without crn, and compare the
+    solutions and end seeds. Results with objpar larger than 1 are not
+    compared to those with 0 or 1, they differ by design.
+
+    Returns
+    -------
+    str or None
+        The first mismatch
+    """
+    for problem, solver, x0, budget in solve_cases:
+        if solver is RSPLINE:
+            continue
+        for crn in (False, True):
+            kwargs = dict(budget=budget, seed=seed, crn=crn, simpar=1)
+            for objpar0, objpar1 in ((0, 1), (2, 3)):
+                res = solve(problem, solver, x0, objpar=objpar0, **kwargs)
+                if not solve(problem, solver, x0, objpar=objpar1, **kwargs) == res:
+                    return '%s %s crn=%s with objpar=%d' % (problem.__name__, solver.__name__, crn, objpar1)
+    return None
+
+
+def check_epspar():
+    """
+    Solve every case using epsilon windows with epspar 1 and 3, with
+    and without crn, and compare the solutions and end seeds. Results
+    with epspar 0 are not compared, they differ by design.
+
+    Returns
+    -------
+    str or None
+        The first mismatch
+    """
+    for problem, solver, x0, budget in solve_cases:
+        if solver not in (RPERLE, RPE):
+            continue
+        for crn in (False, True):
+            kwargs = dict(budget=budget, seed=seed, crn=crn, simpar=1)
+            res = solve(problem, solver, x0, epspar=1, **kwargs)
+            if not solve(problem, solver, x0, epspar=3, **kwargs) == res:
+                return '%s %s crn=%s with epspar=3' % (problem.__name__, solver.__name__, crn)
+    return None
+
+
+def exact_jump(s, a1, a2):
+    """
+    Multiply each half of a seed by a jump matrix in integer arithmetic.
+    """
+    m1 = int(mrgm1)
+    m2 = int(mrgm2)
+    r3 = range(3)
+    s1 = tuple(sum(int(a1[i][j])*s[j] for j in r3) % m1 for i in r3)
+    s2 = tuple(sum(int(a2[i][j])*s[j + 3] for j in r3) % m2 for i in r3)
+    return s1 + s2
+
+
+def check_stream_seeds():
+    """
+    Compare get_stream_seed and get_stream_seeds to repeated exact
+    jumps, and the indexed testsolve streams to get_stream_seed.
+
+    Returns
+    -------
+    str or None
+        The first mismatch
+    """
+    s = seed
+    streams = [s]
+    for k in range(12):
+        s = exact_jump(s, a1p127, a2p127)
+        streams.append(s)
+    for k in range(12):
+        s = streams[k]
+        for j in range(5):
+            if not get_stream_seed(seed, k, j) == s:
+                return 'get_stream_seed(seed, %d, %d)' % (k, j)
+            s = exact_jump(s, a1p76, a2p76)
+    if not get_stream_seeds(seed, 1, 5, 2) == streams[1:11:2]:
+        return 'get_stream_seeds(seed, 1, 5, 2)'
+    orcprns, solprns, xprn, endseed = get_testsolve_prnstreams(3, seed, False, True)
+    if not [prn.get_seed() for prn in solprns] == [get_stream_seed(seed, t + 1) for t in range(3)]:
+        return 'indexed solver streams'
+    if not [prn.get_seed() for prn in orcprns] == [get_stream_seed(seed, 4 + 201*t) for t in range(3)]:
+        return 'indexed oracle streams'
+    return None
+
+
+def check_crn_cache():
+    """
+    Compare generators sharing a small SubstreamCache to generators without
+    one, and the cache size to the uniforms it stores, including when an
+    entry is evicted while its generator keeps drawing from it.
+
+    Returns
+    -------
+    str or None
+        The first mismatch
+    """
+    def stored(cache):
+        return sum(len(entry[0]) for entry in cache.entries.values())
+
+    subs = [get_stream_seed(seed, 0, j) for j in range(4)]
+    cache = SubstreamCache(50)
+    prn1 = MRG32k3a(subs[0])
+    prn1.set_cache(cache)
+    prn2 = MRG32k3a(subs[1])
+    prn2.set_cache(cache)
+    prn2.random_block(40)
+    prn2.seed(subs[3])
+    prn1.random_block(20)
+    prn2.random_block(20)
+    # evicts the entry of subs[0], which prn1 still draws from
+    prn2.seed(subs[1])
+    if subs[0] in cache.entries:
+        return 'no eviction'
+    prn1.random_block(45)
+    prn1.seed(subs[2])
+    if not cache.currsize == stored(cache):
+        return 'evict then grow: currsize %d, stored %d' % (cache.currsize, stored(cache))
+    rng = random.Random(seed[0])
+    cache = SubstreamCache(60)
+    prns = []
+    refs = []
+    for k in range(3):
+        prn = MRG32k3a(subs[0])
+        prn.set_cache(cache)
+        prns.append(prn)
+        refs.append(MRG32k3a(subs[0]))
+    for i in range(300):
+        k = rng.randrange(3)
+        if rng.random() < 0.3:
+            sub = rng.choice(subs)
+            prns[k].seed(sub)
+            refs[k].seed(sub)
+        else:
+            n = rng.randrange(1, 25)
+            if not list(prns[k].random_block(n)) == list(refs[k].random_block(n)):
+                return 'uniforms of draw %d' % i
+    for prn in prns:
+        prn.seed(seed)
+    if not cache.currsize == stored(cache):
+        return 'shared cache: currsize %d, stored %d' % (cache.currsize, stored(cache))
+    return None
+
+
+def rand_objs(rng, n, d, levels):
+    """
+    Generate 'n' objective values of 'd' objectives, each one of 'levels'
+    integers so that sets have ties.
+    """
+    return [tuple(float(rng.randrange(levels)) for k in range(d)) for i in range(n)]
+
+
+def check_dominance():
+    """
+    Compare dominance_mask and dominance_matrix to does_weak_dominate,
+    does_dominate, and does_strict_dominate, with and without
+    relaxations.
+
+    Returns
+    -------
+    str or None
+        The first mismatch
+    """
+    rng = random.Random(1)
+    scalar = {'weak': does_weak_dominate, 'dom': does_dominate, 'strict': does_strict_dominate}
+    for d in (1, 2, 3):
+        objs = rand_objs(rng, 40, d, 4)
+        zeros = [(0.0, )*d]*len(objs)
+        dels = [tuple(rng.choice((0.0, 0.5, 1.0)) for k in range(d)) for g in objs]
+        for kind, dom in scalar.items():
+            for dl in (zeros, dels):
+                ref = [[dom(g, h, dg, dh) for h, dh in zip(objs, dl)] for g, dg in zip(objs, dl)]
+                masks = [dominance_mask(g, objs, dg, dl, kind) for g, dg in zip(objs, dl)]
+                rmasks = [dominance_mask(h, objs, dh, dl, kind, reverse=True) for h, dh in zip(objs, dl)]
+                mat = dominance_matrix(objs, objs, dl, dl, kind)
+                if not masks == ref:
+                    return 'dominance_mask d=%d kind=%s' % (d, kind)
+                if not [list(r) for r in zip(*rmasks)] == ref:
+                    return 'dominance_mask reverse d=%d kind=%s' % (d, kind)
+                if not [[bool(b) for b in row] for row in mat] == ref:
+                    return 'dominance_matrix d=%d kind=%s' % (d, kind)
+    return None
+
+
+def brute_nondom(edict):
+    """
+    Generate the non-dominated points by comparing every pair.
+    """
+    pts = list(edict)
+    nondom = set()
+    for x in pts:
+        gx = edict[x]
+        zero = (0, )*len(gx)
+        if not any(does_dominate(edict[y], gx, zero, zero) for y in pts):
+            nondom.add(x)
+    return nondom
+
+
+def check_nondom():
+    """
+    Compare get_nondom, and the fronts it dispatches to, to comparing
+    every pair, on sets with ties of one to four objectives.
+
+    Returns
+    -------
+    str or None
+        The first mismatch
+    """
+    rng = random.Random(2)
+    for d in (1, 2, 3, 4):
+        for n, levels in ((1, 3), (30, 3), (300, 10), (600, 1000)):
+            objs = rand_objs(rng, n, d, levels)
+            edict = {(i, ): g for i, g in enumerate(objs)}
+            ref = brute_nondom(edict)
+            if not get_nondom(edict) == ref:
+                return 'get_nondom d=%d n=%d' % (d, n)
+            pts = list(edict)
+            sind = argsort(objs)
+            spts = [pts[i] for i in sind]
+            sobjs = [objs[i] for i in sind]
+            if not set(front(spts, sobjs)[0]) == ref:
+                return 'front d=%d n=%d' % (d, n)
+            if not {spts[i] for i in kung_front(sobjs)} == ref:
+                return 'kung_front d=%d n=%d' % (d, n)
+            if d <= 2 and not {spts[i] for i in sweep_front(sobjs)} == ref:
+                return 'sweep_front d=%d n=%d' % (d, n)
+            if np is not None and not {spts[i] for i in block_front(sobjs, 64)} == ref:
+                return 'block_front d=%d n=%d' % (d, n)
+    return None
+
+
+if __name__ == '__main__':
+    checks = [check_parallel_solve, check_objpar, check_epspar, check_stream_seeds, check_crn_cache, check_dominance, check_nondom]
+    failed = False
+    for check in checks:
+        err = check()
+        if err:
+            failed = True
+            print(check.__name__, 'FAILED:', err)
+        else:
+            print(check.__name__, 'ok')
+    sys.exit(1 if failed else 0)